@@ -0,0 +1,27 @@
+-- Migration: Covering indexes for Telegram analytics queries
+-- Description: Lets the bot/time-window aggregates in telegram_manager/db_analytics.py
+--              run as index-only scans instead of touching the heap
+-- Author: System
+-- Date: 2026-10-15
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so apply
+-- this file with plain psql (no --single-transaction / BEGIN).
+
+-- completed_trades: WHERE bot_id = ? AND exit_time >= ? aggregating net_pnl,
+-- total_commission, exit_reason and holding_duration_seconds
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_completed_trades_bot_exit_covering
+    ON trading.completed_trades(bot_id, exit_time DESC)
+    INCLUDE (net_pnl, total_commission, exit_reason, holding_duration_seconds);
+
+-- fills: latest side per (bot, symbol) in a window, plus fill/commission counts
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fills_bot_symbol_exec_covering
+    ON trading.fills(bot_id, symbol, exec_time DESC)
+    INCLUDE (side, commission);
+
+-- The covering indexes supersede the plain ones on the same keys
+DROP INDEX CONCURRENTLY IF EXISTS trading.idx_completed_trades_bot;
+DROP INDEX CONCURRENTLY IF EXISTS trading.idx_fills_bot_symbol;
+
+-- Set the visibility map (index-only scans need it) and refresh planner stats
+VACUUM (ANALYZE) trading.completed_trades;
+VACUUM (ANALYZE) trading.fills;
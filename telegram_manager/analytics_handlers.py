@@ -4,6 +4,7 @@ Analytics Command Handlers for Telegram Bot
 Provides formatted analytics summaries from database
 """
 
+import asyncio
 from datetime import datetime
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -86,11 +87,14 @@ async def analytics_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     await update.message.reply_text("📊 *Generating Analytics Report...*", parse_mode='Markdown')
 
-    # Get trading summary
-    trading_summary = analytics.get_trading_summary(bot_id, days)
-
-    # Get bot info
-    bot_summary = analytics.get_bot_summary(bot_id)
+    # Trading summary, bot info and (for all bots) the portfolio, queried concurrently
+    queries = [
+        asyncio.to_thread(analytics.get_trading_summary, bot_id, days),
+        asyncio.to_thread(analytics.get_bot_summary, bot_id),
+    ]
+    if not bot_id:
+        queries.append(asyncio.to_thread(analytics.get_portfolio_summary))
+    trading_summary, bot_summary, *portfolio = await asyncio.gather(*queries)
 
     # Build report
     report = f"📊 *TRADING ANALYTICS REPORT*\n"
@@ -110,7 +114,7 @@ async def analytics_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
         report += f"└─ Return: {format_percentage(bot['return_pct'])}\n\n"
     else:
         report += f"*PORTFOLIO OVERVIEW*\n"
-        portfolio = analytics.get_portfolio_summary()
+        portfolio = portfolio[0] if portfolio else await asyncio.to_thread(analytics.get_portfolio_summary)
         if portfolio:
             report += f"├─ Total Bots: {portfolio.get('total_bots', 0)}\n"
             report += f"├─ Active: {portfolio.get('active_bots', 0)}\n"
@@ -168,7 +172,7 @@ async def positions_summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
         }
         bot_id = bot_mapping.get(bot_id, bot_id)
 
-    positions = analytics.get_active_positions(bot_id)
+    positions = await asyncio.to_thread(analytics.get_active_positions, bot_id)
 
     report = f"📍 *ACTIVE POSITIONS*\n"
     report += f"━━━━━━━━━━━━━━━━━━━━━\n"
@@ -235,7 +239,7 @@ async def trades_history(update: Update, context: ContextTypes.DEFAULT_TYPE):
         except ValueError:
             limit = 10
 
-    trades = analytics.get_recent_trades(bot_id, limit)
+    trades = await asyncio.to_thread(analytics.get_recent_trades, bot_id, limit)
 
     report = f"📋 *RECENT TRADES*\n"
     report += f"━━━━━━━━━━━━━━━━━━━━━\n"
@@ -303,7 +307,7 @@ async def daily_performance(update: Update, context: ContextTypes.DEFAULT_TYPE):
         except ValueError:
             days = 7
 
-    performance = analytics.get_daily_performance(bot_id, days)
+    performance = await asyncio.to_thread(analytics.get_daily_performance, bot_id, days)
 
     report = f"📅 *DAILY PERFORMANCE*\n"
     report += f"━━━━━━━━━━━━━━━━━━━━━\n"
@@ -342,7 +346,7 @@ async def cache_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
     /cache - Display Redis cache statistics
     """
     analytics = get_analytics()
-    stats = analytics.get_redis_stats()
+    stats = await asyncio.to_thread(analytics.get_redis_stats)
 
     report = f"💾 *CACHE STATISTICS*\n"
     report += f"━━━━━━━━━━━━━━━━━━━━━\n"
@@ -367,14 +371,12 @@ async def quick_status(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     analytics = get_analytics()
 
-    # Get portfolio summary
-    portfolio = analytics.get_portfolio_summary()
-
-    # Get today's trading
-    trading_today = analytics.get_trading_summary(days=1)
-
-    # Get active positions
-    positions = analytics.get_active_positions()
+    # Portfolio, today's trading and active positions, queried concurrently
+    portfolio, trading_today, positions = await asyncio.gather(
+        asyncio.to_thread(analytics.get_portfolio_summary),
+        asyncio.to_thread(analytics.get_trading_summary, days=1),
+        asyncio.to_thread(analytics.get_active_positions),
+    )
 
     report = f"⚡ *QUICK STATUS*\n"
     report += f"━━━━━━━━━━━━━━━━━━━━━\n"
@@ -12,10 +12,15 @@ Trading Operations Management System
 """
 
 import os
+import re
+import hmac
+import time
 import logging
 import docker
 import asyncio
-from datetime import datetime
+import threading
+from functools import partial, wraps
+from datetime import datetime, timezone
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     Application,
@@ -26,6 +31,17 @@ from telegram.ext import (
     filters
 )
 
+# Configure logging
+logging.basicConfig(
+    format='%(asctime)s - [%(levelname)s] - %(message)s',
+    level=logging.INFO,
+    handlers=[
+        logging.FileHandler('/app/logs/command_center.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
 # Import analytics handlers
 try:
     from analytics_handlers import (
@@ -38,34 +54,90 @@ try:
     )
     ANALYTICS_AVAILABLE = True
 except ImportError as e:
-    logger.warning(f"Analytics handlers not available: {e}")
+    logger.warning("Analytics handlers not available: %s", e)
     ANALYTICS_AVAILABLE = False
 
-# Configure logging
-logging.basicConfig(
-    format='%(asctime)s - [%(levelname)s] - %(message)s',
-    level=logging.INFO,
-    handlers=[
-        logging.FileHandler('/app/logs/command_center.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
-
 # Configuration
 BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-ADMIN_IDS = [int(id.strip()) for id in os.getenv('TELEGRAM_ADMIN_IDS', '').split(',') if id.strip()]
+ADMIN_IDS = frozenset(int(id.strip()) for id in os.getenv('TELEGRAM_ADMIN_IDS', '').split(',') if id.strip())
+UPDATE_CONCURRENCY = 32  # Telegram updates handled at once
 
 # Security Configuration
 ACCESS_CODE = os.getenv('COMMAND_CENTER_ACCESS_CODE', 'ALPHA2025')  # Default code, should be changed
 SESSION_TIMEOUT = int(os.getenv('SESSION_TIMEOUT_MINUTES', '30'))  # Session expires after 30 minutes
+SESSION_TIMEOUT_SEC = SESSION_TIMEOUT * 60
+SESSION_SWEEP_INTERVAL = SESSION_TIMEOUT_SEC / 4  # Expired sessions are purged at this cadence
+SESSION_REFRESH_INTERVAL = 5  # Minimum seconds between session timestamp writes
 MESSAGE_DELETE_DELAY = int(os.getenv('AUTH_MESSAGE_DELETE_SECONDS', '20'))  # Auto-delete auth messages after N seconds
 
-# Active sessions: {user_id: last_activity_timestamp}
+# Active sessions: {user_id: last_activity time.monotonic()}
 active_sessions = {}
 
-# Docker client
-docker_client = docker.from_env()
+# Request coalescing: {key: asyncio.Task} for reports currently being generated
+_inflight_requests = {}
+
+# Long-running loops started in post_init, cancelled in post_shutdown
+_background_tasks = []
+
+# Wrappers built by requires_authentication, tracked by identity: a function
+# attribute marker would be copied onto outer decorators by functools.wraps
+_authenticated_handlers = set()
+
+# Last generated SITREP: (monotonic_timestamp, text)
+SITREP_CACHE_SECONDS = 2
+_sitrep_cached = None
+
+# Diagnostics button summaries by container name: {name: (monotonic_timestamp, text)}
+DIAGNOSTICS_CACHE_SECONDS = 1
+_diagnostics_cache = {}
+
+# Last CPU sample per container name, so diagnostics can use one-shot stats: {name: cpu_stats}
+_cpu_samples = {}
+
+# Container objects by name: {name: (monotonic_timestamp, Container)}
+CONTAINER_CACHE_SECONDS = 3
+_container_cache = {}
+
+# Bumped on every container state event so in-flight reports aren't cached stale
+_status_generation = 0
+
+# Docker events that change what SITREP reports
+CONTAINER_STATE_EVENTS = ('create', 'start', 'restart', 'stop', 'die', 'kill', 'pause', 'unpause', 'destroy')
+
+# State a container is in after each event ('kill' only signals, 'destroy' removes it)
+EVENT_CONTAINER_STATES = {
+    'create': 'created',
+    'start': 'running',
+    'restart': 'running',
+    'unpause': 'running',
+    'pause': 'paused',
+    'stop': 'exited',
+    'die': 'exited',
+}
+
+# Container states by name, kept current by the events watcher: {name: state}
+# None until listed, and whenever the event stream isn't connected
+_container_states = None
+_events_connected = False
+EVENT_RECONNECT_DELAY = 5  # Seconds before re-subscribing after the event stream drops
+STATE_PREFETCH_INTERVAL = 5  # Seconds between checks that the container state snapshot is populated
+
+# Report timestamp format (always rendered in UTC)
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+# Docker stats report bytes; diagnostics display MB
+BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Intel log excerpts are trimmed to this many characters (Telegram caps messages at 4096)
+INTEL_MAX_CHARS = 3800
+
+# Characters with meaning in Telegram's legacy Markdown parse mode
+MD_ESCAPE_PATTERN = re.compile(r'([_*`\[])')
+
+# Docker client - blocking calls are bounded so a burst of taps can't exhaust the connection pool
+DOCKER_MAX_CONCURRENCY = 8
+docker_client = docker.from_env(max_pool_size=DOCKER_MAX_CONCURRENCY + 2)  # +events stream
+docker_semaphore = asyncio.Semaphore(DOCKER_MAX_CONCURRENCY)
 
 # System mappings - Military style designation
 # Container names match docker-compose.production.yml
@@ -115,9 +187,247 @@ SYSTEMS = {
 }
 
 # System groups for bulk operations
-TRADING_SYSTEMS = ['alpha', 'bravo', 'charlie']
-INFRASTRUCTURE_SYSTEMS = ['database', 'pgbouncer', 'cache', 'websocket']
-ALL_SYSTEMS = list(SYSTEMS.keys())
+TRADING_SYSTEMS = ('alpha', 'bravo', 'charlie')
+INFRASTRUCTURE_SYSTEMS = ('database', 'pgbouncer', 'cache', 'websocket')
+ALL_SYSTEMS = tuple(SYSTEMS)
+
+# Flat lookups for the fields read on every status/mass-operation pass
+CONTAINER_NAMES = {system_id: system['container'] for system_id, system in SYSTEMS.items()}
+SYSTEM_NAMES = {system_id: system['name'] for system_id, system in SYSTEMS.items()}
+MANAGED_CONTAINERS = frozenset(CONTAINER_NAMES.values())
+
+# Mass operation report text and log labels
+MASS_OPERATIONS = {
+    'deploy': {
+        'progress': "🚀 *INITIATING MASS DEPLOYMENT...*",
+        'complete': "🚀 *DEPLOYMENT COMPLETE*",
+        'done_log': "Deployed",
+        'error_log': "Deploy error"
+    },
+    'terminate': {
+        'progress': "🛑 *INITIATING MASS SHUTDOWN...*",
+        'complete': "🛑 *SHUTDOWN COMPLETE*",
+        'done_log': "Terminated",
+        'error_log': "Terminate error"
+    },
+    'reboot': {
+        'progress': "🔄 *INITIATING MASS REBOOT...*",
+        'complete': "🔄 *REBOOT COMPLETE*",
+        'done_log': "Rebooted",
+        'error_log': "Reboot error"
+    }
+}
+
+# Minimum seconds between in-progress edits of a mass operation report (Telegram flood limits)
+MASS_PROGRESS_EDIT_INTERVAL = 0.75
+
+# Group sizes and SITREP health thresholds
+N_TRADING = len(TRADING_SYSTEMS)
+N_INFRA = len(INFRASTRUCTURE_SYSTEMS)
+N_ALL = len(ALL_SYSTEMS)
+PARTIAL_THRESHOLD = N_ALL * 0.7  # At or above this many systems up = partial operations
+
+
+# ========================================
+# STATIC MESSAGES
+# ========================================
+
+REPORT_SEPARATOR = "━" * 21
+
+# Per-system report headers: {system_id: header}
+INTEL_HEADERS = {
+    system_id: f"📡 *INTEL: {system['name']}*\n{REPORT_SEPARATOR}\n\n"
+    for system_id, system in SYSTEMS.items()
+}
+DIAGNOSTICS_HEADERS = {
+    system_id: f"🔬 *DIAGNOSTICS: {system['name']}*\n{REPORT_SEPARATOR}\n\n"
+    for system_id, system in SYSTEMS.items()
+}
+
+# Mass operation report headers: {progress/complete title: header}
+MASS_REPORT_HEADERS = {
+    title: f"{title}\n{REPORT_SEPARATOR}\n\n"
+    for op in MASS_OPERATIONS.values()
+    for title in (op['progress'], op['complete'])
+}
+
+COMMAND_CENTER_TEXT = (
+    "🎯 *ALPHA COMMAND CENTER*\n"
+    "━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "*OPERATIONAL SYSTEMS:*\n"
+    "▸ ALPHA - Multi-Asset Short Seller\n"
+    "▸ BRAVO - LX Algorithm Executor\n"
+    "▸ CHARLIE - Momentum Strategy\n\n"
+    "*SUPPORT INFRASTRUCTURE:*\n"
+    "▸ DATABASE CORE - PostgreSQL\n"
+    "▸ CACHE CORE - Redis\n\n"
+    "Select tactical option:"
+)
+
+COMMAND_CENTER_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 TACTICAL OVERVIEW", callback_data='sitrep')],
+    [
+        InlineKeyboardButton("🚀 DEPLOY ALL", callback_data='deploy_all'),
+        InlineKeyboardButton("🔴 KILL SWITCH", callback_data='killswitch')
+    ],
+    [
+        InlineKeyboardButton("⚡ TRADING SYSTEMS", callback_data='menu_trading'),
+        InlineKeyboardButton("🔧 INFRASTRUCTURE", callback_data='menu_infrastructure')
+    ],
+    [
+        InlineKeyboardButton("📡 SYSTEM LOGS", callback_data='menu_logs'),
+        InlineKeyboardButton("📈 ANALYTICS", callback_data='menu_analytics')
+    ],
+    [
+        InlineKeyboardButton("🔄 MASS RESTART", callback_data='restart_all'),
+        InlineKeyboardButton("⚙️ ADVANCED OPS", callback_data='menu_advanced')
+    ]
+])
+
+KILLSWITCH_CONFIRM_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔴 CONFIRM KILLSWITCH", callback_data='terminate_all')],
+    [InlineKeyboardButton("❌ ABORT", callback_data='sitrep')]
+])
+
+TRADING_MENU_MARKUP = InlineKeyboardMarkup([
+    row
+    for system_id in TRADING_SYSTEMS
+    for row in (
+        [InlineKeyboardButton(f"⚡ {SYSTEM_NAMES[system_id]}", callback_data='noop')],
+        [
+            InlineKeyboardButton("🚀 Deploy", callback_data=f'deploy_{system_id}'),
+            InlineKeyboardButton("🛑 Terminate", callback_data=f'terminate_{system_id}'),
+            InlineKeyboardButton("🔄 Reboot", callback_data=f'reboot_{system_id}')
+        ],
+        [
+            InlineKeyboardButton("📡 Intel", callback_data=f'intel_{system_id}'),
+            InlineKeyboardButton("🔬 Diagnostics", callback_data=f'diag_{system_id}')
+        ],
+    )
+])
+
+INFRASTRUCTURE_MENU_MARKUP = InlineKeyboardMarkup([
+    row
+    for system_id in INFRASTRUCTURE_SYSTEMS
+    for row in (
+        [InlineKeyboardButton(f"🔧 {SYSTEM_NAMES[system_id]}", callback_data='noop')],
+        [
+            InlineKeyboardButton("🚀 Deploy", callback_data=f'deploy_{system_id}'),
+            InlineKeyboardButton("🛑 Terminate", callback_data=f'terminate_{system_id}'),
+            InlineKeyboardButton("🔄 Reboot", callback_data=f'reboot_{system_id}')
+        ],
+    )
+])
+
+LOGS_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton(f"📡 {SYSTEM_NAMES[system_id]}", callback_data=f'intel_{system_id}')]
+    for system_id in ALL_SYSTEMS
+])
+
+ANALYTICS_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("⚡ Quick Status", callback_data='analytics_quick')],
+    [InlineKeyboardButton("📊 Full Analytics Report", callback_data='analytics_full')],
+    [InlineKeyboardButton("📍 Active Positions", callback_data='analytics_positions')],
+    [InlineKeyboardButton("📋 Recent Trades", callback_data='analytics_trades')],
+    [InlineKeyboardButton("📅 Daily Performance", callback_data='analytics_daily')],
+    [InlineKeyboardButton("💾 Cache Stats", callback_data='analytics_cache')],
+])
+
+ADVANCED_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🚀 Deploy All Systems", callback_data='deploy_all')],
+    [InlineKeyboardButton("🛑 Terminate All Systems", callback_data='terminate_all')],
+    [InlineKeyboardButton("🔄 Reboot All Systems", callback_data='restart_all')],
+    [InlineKeyboardButton("🔴 KILLSWITCH", callback_data='killswitch')],
+])
+
+SYSTEMS_LIST_STR = '\n'.join(f"  • {k} - {v['description']}" for k, v in SYSTEMS.items())
+
+DEPLOY_USAGE_MSG = (
+    "*DEPLOY COMMAND USAGE:*\n"
+    "`/deploy <system_id>`\n\n"
+    f"*AVAILABLE SYSTEMS:*\n{SYSTEMS_LIST_STR}"
+)
+
+TERMINATE_USAGE_MSG = (
+    "*TERMINATE COMMAND USAGE:*\n"
+    "`/terminate <system_id>`\n\n"
+    f"*AVAILABLE SYSTEMS:*\n{SYSTEMS_LIST_STR}"
+)
+
+REBOOT_USAGE_MSG = (
+    "*REBOOT COMMAND USAGE:*\n"
+    "`/reboot <system_id>`\n\n"
+    f"*AVAILABLE SYSTEMS:*\n{SYSTEMS_LIST_STR}"
+)
+
+HELP_TEXT = """🎯 *COMMAND CENTER REFERENCE*
+━━━━━━━━━━━━━━━━━━━━━
+
+*AUTHENTICATION:*
+`/auth <code>` - Authenticate Session
+`/logout` - End Session
+`/status` - Check Session Status
+
+*SITUATION AWARENESS:*
+`/cc` - Command Center (Main Menu)
+`/sitrep` - Full System Status
+`/diagnostics <system>` - Detailed Diagnostics
+
+*SYSTEM CONTROL:*
+`/deploy <system>` - Start System
+`/terminate <system>` - Stop System
+`/reboot <system>` - Restart System
+
+*INTELLIGENCE:*
+`/intel <system> [lines]` - View System Logs
+`/execute <system> <cmd>` - Execute Command
+
+*MASS OPERATIONS:*
+`/deploy_all` - Deploy All Systems
+`/terminate_all` - Shutdown All Systems
+`/reboot_all` - Restart All Systems
+
+*EMERGENCY:*
+`/killswitch CONFIRM` - Emergency Trading Halt
+"""
+
+if ANALYTICS_AVAILABLE:
+    HELP_TEXT += """
+*ANALYTICS & TRADING:*
+`/quick` - Quick Status Overview
+`/analytics [bot] [days]` - Full Report
+`/positions [bot]` - Active Positions
+`/trades [bot] [limit]` - Recent Trades
+`/daily [bot] [days]` - Daily Performance
+`/cache` - Redis Cache Stats
+"""
+
+HELP_TEXT += """
+━━━━━━━━━━━━━━━━━━━━━
+*SYSTEM IDENTIFIERS:*
+
+Trading Systems:
+  • `alpha` - Multi-Asset Short Seller
+  • `bravo` - LX Algorithm
+  • `charlie` - Momentum Strategy
+
+Infrastructure:
+  • `database` - PostgreSQL Core
+  • `cache` - Redis Cache
+
+━━━━━━━━━━━━━━━━━━━━━
+*EXAMPLES:*
+
+`/deploy alpha`
+`/intel bravo 100`
+`/diagnostics charlie`
+`/execute alpha ps aux`"""
+
+if ANALYTICS_AVAILABLE:
+    HELP_TEXT += """
+`/analytics alpha 7`
+`/positions bravo`
+`/trades charlie 20`"""
 
 
 # ========================================
@@ -126,44 +436,85 @@ ALL_SYSTEMS = list(SYSTEMS.keys())
 
 def is_session_active(user_id: int) -> bool:
     """Check if user has an active session"""
-    if user_id not in active_sessions:
+    last_activity = active_sessions.get(user_id)
+    if last_activity is None:
         return False
 
-    # Check if session has expired
-    last_activity = active_sessions[user_id]
-    elapsed_minutes = (datetime.now() - last_activity).total_seconds() / 60
-
-    if elapsed_minutes > SESSION_TIMEOUT:
+    # Sessions can expire between sweeps, so still check the timestamp
+    if time.monotonic() - last_activity > SESSION_TIMEOUT_SEC:
         # Session expired
-        del active_sessions[user_id]
+        active_sessions.pop(user_id, None)
         return False
 
     return True
 
 
-def refresh_session(user_id: int):
-    """Refresh user session timestamp"""
-    active_sessions[user_id] = datetime.now()
+def touch_session(user_id: int) -> bool:
+    """Check the session is active and refresh its timestamp in one lookup"""
+    last_activity = active_sessions.get(user_id)
+    if last_activity is None:
+        return False
+
+    now = time.monotonic()
+    idle = now - last_activity
+    if idle > SESSION_TIMEOUT_SEC:
+        active_sessions.pop(user_id, None)
+        return False
+
+    # Rewriting an almost-identical timestamp on every command buys nothing
+    if idle > SESSION_REFRESH_INTERVAL:
+        active_sessions[user_id] = now
+    return True
 
 
 def create_session(user_id: int):
     """Create a new session for user"""
-    active_sessions[user_id] = datetime.now()
-    logger.info(f"✓ SESSION CREATED: User ID {user_id}")
+    active_sessions[user_id] = time.monotonic()
+    logger.info("✓ SESSION CREATED: User ID %s", user_id)
 
 
 def end_session(user_id: int):
     """Terminate user session"""
     if user_id in active_sessions:
         del active_sessions[user_id]
-        logger.info(f"✓ SESSION ENDED: User ID {user_id}")
+        logger.info("✓ SESSION ENDED: User ID %s", user_id)
+
+
+async def sweep_expired_sessions():
+    """Periodically drop expired sessions so active_sessions stays bounded"""
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL)
+        now = time.monotonic()
+        for user_id, last_activity in list(active_sessions.items()):
+            if now - last_activity > SESSION_TIMEOUT_SEC:
+                active_sessions.pop(user_id, None)
+                logger.info("✓ SESSION EXPIRED: User ID %s", user_id)
+
+
+async def post_init(application: Application):
+    """Start background tasks on the application's event loop"""
+    _background_tasks.append(asyncio.create_task(sweep_expired_sessions()))
+    _background_tasks.append(asyncio.create_task(prefetch_container_states()))
+
+
+async def post_shutdown(application: Application):
+    """Cancel the background tasks started in post_init and wait for them to finish"""
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
 
 
 def requires_authentication(func):
     """Decorator that requires both authorization and active session"""
+    if func in _authenticated_handlers:
+        return func  # Already wrapped
+
+    @wraps(func)
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        user_id = update.effective_user.id
-        username = update.effective_user.username or "Unknown"
+        user = update.effective_user
+        user_id = user.id
+        username = user.username or "Unknown"
 
         # First check: Is user in authorized list?
         if user_id not in ADMIN_IDS:
@@ -173,11 +524,11 @@ def requires_authentication(func):
                 "Unauthorized access attempt logged.",
                 parse_mode='Markdown'
             )
-            logger.warning(f"❌ UNAUTHORIZED ACCESS: User {username} (ID: {user_id})")
+            logger.warning("❌ UNAUTHORIZED ACCESS: User %s (ID: %s)", username, user_id)
             return
 
-        # Second check: Does user have an active session?
-        if not is_session_active(user_id):
+        # Second check: Does user have an active session? (refreshed on each command)
+        if not touch_session(user_id):
             await update.message.reply_text(
                 "🔐 *SESSION EXPIRED*\n\n"
                 "Your session has expired or you haven't authenticated yet.\n"
@@ -185,34 +536,12 @@ def requires_authentication(func):
                 f"Example: `/auth {ACCESS_CODE[:4]}****`",
                 parse_mode='Markdown'
             )
-            logger.warning(f"⚠️ SESSION EXPIRED: User {username} (ID: {user_id})")
-            return
-
-        # Refresh session on each command
-        refresh_session(user_id)
-        logger.info(f"✓ AUTHENTICATED: {username} (ID: {user_id}) - Command: {update.message.text}")
-        return await func(update, context)
-    return wrapper
-
-
-def authorized_only(func):
-    """Security clearance check - Restrict to authorized operators only"""
-    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        user_id = update.effective_user.id
-        username = update.effective_user.username or "Unknown"
-
-        if user_id not in ADMIN_IDS:
-            await update.message.reply_text(
-                "⛔ *ACCESS DENIED*\n\n"
-                "Security clearance required.\n"
-                "Unauthorized access attempt logged.",
-                parse_mode='Markdown'
-            )
-            logger.warning(f"❌ UNAUTHORIZED ACCESS: User {username} (ID: {user_id})")
+            logger.warning("⚠️ SESSION EXPIRED: User %s (ID: %s)", username, user_id)
             return
 
-        logger.info(f"✓ AUTHORIZED: {username} (ID: {user_id}) - Command: {update.message.text}")
+        logger.info("✓ AUTHENTICATED: %s (ID: %s) - Command: %s", username, user_id, update.message.text)
         return await func(update, context)
+    _authenticated_handlers.add(wrapper)
     return wrapper
 
 
@@ -223,39 +552,9 @@ def authorized_only(func):
 @requires_authentication
 async def command_center(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Main command center interface"""
-    keyboard = [
-        [InlineKeyboardButton("📊 TACTICAL OVERVIEW", callback_data='sitrep')],
-        [
-            InlineKeyboardButton("🚀 DEPLOY ALL", callback_data='deploy_all'),
-            InlineKeyboardButton("🔴 KILL SWITCH", callback_data='killswitch')
-        ],
-        [
-            InlineKeyboardButton("⚡ TRADING SYSTEMS", callback_data='menu_trading'),
-            InlineKeyboardButton("🔧 INFRASTRUCTURE", callback_data='menu_infrastructure')
-        ],
-        [
-            InlineKeyboardButton("📡 SYSTEM LOGS", callback_data='menu_logs'),
-            InlineKeyboardButton("📈 ANALYTICS", callback_data='menu_analytics')
-        ],
-        [
-            InlineKeyboardButton("🔄 MASS RESTART", callback_data='restart_all'),
-            InlineKeyboardButton("⚙️ ADVANCED OPS", callback_data='menu_advanced')
-        ]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await update.message.reply_text(
-        "🎯 *ALPHA COMMAND CENTER*\n"
-        "━━━━━━━━━━━━━━━━━━━━━\n\n"
-        "*OPERATIONAL SYSTEMS:*\n"
-        "▸ ALPHA - Multi-Asset Short Seller\n"
-        "▸ BRAVO - LX Algorithm Executor\n"
-        "▸ CHARLIE - Momentum Strategy\n\n"
-        "*SUPPORT INFRASTRUCTURE:*\n"
-        "▸ DATABASE CORE - PostgreSQL\n"
-        "▸ CACHE CORE - Redis\n\n"
-        "Select tactical option:",
-        reply_markup=reply_markup,
+        COMMAND_CENTER_TEXT,
+        reply_markup=COMMAND_CENTER_MARKUP,
         parse_mode='Markdown'
     )
 
@@ -265,49 +564,7 @@ async def sitrep(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Situation Report - Full system status"""
     message = await update.message.reply_text("🔍 *GENERATING SITREP...*", parse_mode='Markdown')
 
-    status_text = "📊 *TACTICAL SITUATION REPORT*\n"
-    status_text += f"━━━━━━━━━━━━━━━━━━━━━\n"
-    status_text += f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
-
-    # Trading Systems Status
-    status_text += "*🎯 TRADING SYSTEMS*\n"
-    trading_operational = 0
-
-    for system_id in TRADING_SYSTEMS:
-        system = SYSTEMS[system_id]
-        status_line, is_running = await get_system_status(system)
-        status_text += status_line
-        if is_running:
-            trading_operational += 1
-
-    # Infrastructure Status
-    status_text += "\n*🔧 INFRASTRUCTURE*\n"
-    infra_operational = 0
-
-    for system_id in INFRASTRUCTURE_SYSTEMS:
-        system = SYSTEMS[system_id]
-        status_line, is_running = await get_system_status(system)
-        status_text += status_line
-        if is_running:
-            infra_operational += 1
-
-    # Overall Status Summary
-    status_text += "\n━━━━━━━━━━━━━━━━━━━━━\n"
-    status_text += f"*OPERATIONAL STATUS:*\n"
-    status_text += f"├─ Trading: {trading_operational}/{len(TRADING_SYSTEMS)}\n"
-    status_text += f"└─ Infrastructure: {infra_operational}/{len(INFRASTRUCTURE_SYSTEMS)}\n"
-
-    # Overall health
-    total_operational = trading_operational + infra_operational
-    total_systems = len(ALL_SYSTEMS)
-
-    if total_operational == total_systems:
-        status_text += "\n🟢 *ALL SYSTEMS OPERATIONAL*"
-    elif total_operational >= total_systems * 0.7:
-        status_text += "\n🟡 *PARTIAL OPERATIONS*"
-    else:
-        status_text += "\n🔴 *CRITICAL: MULTIPLE SYSTEMS DOWN*"
-
+    status_text = await get_sitrep_text()
     await message.edit_text(status_text, parse_mode='Markdown')
 
 
@@ -315,21 +572,10 @@ async def sitrep(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def deploy(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Deploy (start) specific system"""
     if len(context.args) < 1:
-        systems_list = '\n'.join([f"  • {k} - {v['description']}" for k, v in SYSTEMS.items()])
-        await update.message.reply_text(
-            f"*DEPLOY COMMAND USAGE:*\n"
-            f"`/deploy <system_id>`\n\n"
-            f"*AVAILABLE SYSTEMS:*\n{systems_list}",
-            parse_mode='Markdown'
-        )
+        await update.message.reply_text(DEPLOY_USAGE_MSG, parse_mode='Markdown')
         return
 
     system_id = context.args[0].lower()
-
-    if system_id not in SYSTEMS:
-        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{system_id}`", parse_mode='Markdown')
-        return
-
     await execute_system_action(update, system_id, 'deploy')
 
 
@@ -337,21 +583,10 @@ async def deploy(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def terminate(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Terminate (stop) specific system"""
     if len(context.args) < 1:
-        systems_list = '\n'.join([f"  • {k} - {v['description']}" for k, v in SYSTEMS.items()])
-        await update.message.reply_text(
-            f"*TERMINATE COMMAND USAGE:*\n"
-            f"`/terminate <system_id>`\n\n"
-            f"*AVAILABLE SYSTEMS:*\n{systems_list}",
-            parse_mode='Markdown'
-        )
+        await update.message.reply_text(TERMINATE_USAGE_MSG, parse_mode='Markdown')
         return
 
     system_id = context.args[0].lower()
-
-    if system_id not in SYSTEMS:
-        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{system_id}`", parse_mode='Markdown')
-        return
-
     await execute_system_action(update, system_id, 'terminate')
 
 
@@ -359,21 +594,10 @@ async def terminate(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def reboot(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Reboot (restart) specific system"""
     if len(context.args) < 1:
-        systems_list = '\n'.join([f"  • {k} - {v['description']}" for k, v in SYSTEMS.items()])
-        await update.message.reply_text(
-            f"*REBOOT COMMAND USAGE:*\n"
-            f"`/reboot <system_id>`\n\n"
-            f"*AVAILABLE SYSTEMS:*\n{systems_list}",
-            parse_mode='Markdown'
-        )
+        await update.message.reply_text(REBOOT_USAGE_MSG, parse_mode='Markdown')
         return
 
     system_id = context.args[0].lower()
-
-    if system_id not in SYSTEMS:
-        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{system_id}`", parse_mode='Markdown')
-        return
-
     await execute_system_action(update, system_id, 'reboot')
 
 
@@ -391,66 +615,66 @@ async def diagnostics(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     system_id = context.args[0].lower()
 
-    if system_id not in SYSTEMS:
-        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{system_id}`", parse_mode='Markdown')
+    system = SYSTEMS.get(system_id)
+    if system is None:
+        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{md_code(system_id)}`", parse_mode='Markdown')
         return
-
-    system = SYSTEMS[system_id]
     message = await update.message.reply_text(f"🔍 *RUNNING DIAGNOSTICS: {system['name']}*", parse_mode='Markdown')
 
     try:
-        container = docker_client.containers.get(system['container'])
+        container = await docker_call(get_container, system['container'])
 
         # Get detailed stats
         status = container.status
-        stats = container.stats(stream=False) if status == 'running' else None
+        stats = await docker_call(get_container_stats, container) if status == 'running' else None
 
-        diag_text = f"🔬 *SYSTEM DIAGNOSTICS*\n"
-        diag_text += f"━━━━━━━━━━━━━━━━━━━━━\n\n"
-        diag_text += f"*SYSTEM:* {system['name']}\n"
-        diag_text += f"*ID:* `{system_id}`\n"
-        diag_text += f"*TYPE:* {system['type'].upper()}\n"
-        diag_text += f"*CONTAINER:* `{system['container']}`\n\n"
+        parts = [f"🔬 *SYSTEM DIAGNOSTICS*\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━\n\n")
+        parts.append(f"*SYSTEM:* {system['name']}\n")
+        parts.append(f"*ID:* `{system_id}`\n")
+        parts.append(f"*TYPE:* {system['type'].upper()}\n")
+        parts.append(f"*CONTAINER:* `{system['container']}`\n\n")
 
         # Status
         if status == 'running':
-            diag_text += "🟢 *STATUS:* OPERATIONAL\n\n"
+            parts.append("🟢 *STATUS:* OPERATIONAL\n\n")
 
             if stats:
                 # CPU Usage
                 cpu_percent = calculate_cpu_percent(stats)
-                diag_text += f"*CPU USAGE:* {cpu_percent:.2f}%\n"
+                parts.append(f"*CPU USAGE:* {cpu_percent:.2f}%\n")
 
                 # Memory Usage
-                mem_usage = stats['memory_stats'].get('usage', 0) / (1024**2)
-                mem_limit = stats['memory_stats'].get('limit', 0) / (1024**2)
+                mem = stats.get('memory_stats', {})
+                mem_usage = mem.get('usage', 0) * BYTES_TO_MB
+                mem_limit = mem.get('limit', 0) * BYTES_TO_MB
                 mem_percent = (mem_usage / mem_limit * 100) if mem_limit > 0 else 0
-                diag_text += f"*MEMORY:* {mem_usage:.1f}MB / {mem_limit:.1f}MB ({mem_percent:.1f}%)\n"
+                parts.append(f"*MEMORY:* {mem_usage:.1f}MB / {mem_limit:.1f}MB ({mem_percent:.1f}%)\n")
 
                 # Network I/O
                 net_stats = stats.get('networks', {})
                 if net_stats:
                     for iface, data in net_stats.items():
-                        rx_mb = data.get('rx_bytes', 0) / (1024**2)
-                        tx_mb = data.get('tx_bytes', 0) / (1024**2)
-                        diag_text += f"*NETWORK ({iface}):*\n"
-                        diag_text += f"  ├─ RX: {rx_mb:.2f}MB\n"
-                        diag_text += f"  └─ TX: {tx_mb:.2f}MB\n"
+                        rx_mb = data.get('rx_bytes', 0) * BYTES_TO_MB
+                        tx_mb = data.get('tx_bytes', 0) * BYTES_TO_MB
+                        parts.append(f"*NETWORK ({iface}):*\n")
+                        parts.append(f"  ├─ RX: {rx_mb:.2f}MB\n")
+                        parts.append(f"  └─ TX: {tx_mb:.2f}MB\n")
 
         elif status == 'exited':
-            diag_text += "🔴 *STATUS:* OFFLINE\n"
+            parts.append("🔴 *STATUS:* OFFLINE\n")
             # Get exit code
             exit_code = container.attrs.get('State', {}).get('ExitCode', 'Unknown')
-            diag_text += f"*EXIT CODE:* {exit_code}\n"
+            parts.append(f"*EXIT CODE:* {exit_code}\n")
         else:
-            diag_text += f"🟡 *STATUS:* {status.upper()}\n"
+            parts.append(f"🟡 *STATUS:* {status.upper()}\n")
 
         # Uptime
         started_at = container.attrs.get('State', {}).get('StartedAt', 'Unknown')
         if started_at != 'Unknown' and status == 'running':
-            diag_text += f"\n*STARTED:* {started_at[:19]}\n"
+            parts.append(f"\n*STARTED:* {started_at[:19]}\n")
 
-        await message.edit_text(diag_text, parse_mode='Markdown')
+        await message.edit_text(''.join(parts), parse_mode='Markdown')
 
     except docker.errors.NotFound:
         await message.edit_text(
@@ -459,8 +683,8 @@ async def diagnostics(update: Update, context: ContextTypes.DEFAULT_TYPE):
             parse_mode='Markdown'
         )
     except Exception as e:
-        await message.edit_text(f"❌ *DIAGNOSTIC ERROR*\n\n`{str(e)}`", parse_mode='Markdown')
-        logger.error(f"Diagnostics error for {system_id}: {e}")
+        await message.edit_text(f"❌ *DIAGNOSTIC ERROR*\n\n`{md_code(str(e))}`", parse_mode='Markdown')
+        logger.error("Diagnostics error for %s: %s", system_id, e)
 
 
 @requires_authentication
@@ -477,29 +701,19 @@ async def intel(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     system_id = context.args[0].lower()
-    lines = int(context.args[1]) if len(context.args) > 1 else 50
-    lines = min(lines, 200)  # Max 200 lines
+    lines = 50
+    if len(context.args) > 1 and context.args[1].isdecimal():
+        lines = min(max(int(context.args[1]), 1), 200)  # 1-200 lines
 
-    if system_id not in SYSTEMS:
-        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{system_id}`", parse_mode='Markdown')
+    system = SYSTEMS.get(system_id)
+    if system is None:
+        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{md_code(system_id)}`", parse_mode='Markdown')
         return
 
-    system = SYSTEMS[system_id]
-
     try:
-        container = docker_client.containers.get(system['container'])
-        logs_output = container.logs(tail=lines).decode('utf-8', errors='ignore')
-
-        # Split into chunks if too long
-        max_length = 3800
-        header = f"📡 *INTEL: {system['name']}*\n━━━━━━━━━━━━━━━━━━━━━\n\n"
+        logs_output = await docker_call(fetch_log_tail, system['container'], lines)
 
-        if len(logs_output) > max_length:
-            # Take the last max_length characters
-            logs_output = logs_output[-max_length:]
-            chunks = [header + f"```\n{logs_output}\n```"]
-        else:
-            chunks = [header + f"```\n{logs_output}\n```"]
+        chunks = [INTEL_HEADERS[system_id] + f"```\n{md_code(logs_output)}\n```"]
 
         for chunk in chunks:
             await update.message.reply_text(chunk, parse_mode='Markdown')
@@ -510,8 +724,8 @@ async def intel(update: Update, context: ContextTypes.DEFAULT_TYPE):
             parse_mode='Markdown'
         )
     except Exception as e:
-        await update.message.reply_text(f"❌ *ERROR:* `{str(e)}`", parse_mode='Markdown')
-        logger.error(f"Intel error for {system_id}: {e}")
+        await update.message.reply_text(f"❌ *ERROR:* `{md_code(str(e))}`", parse_mode='Markdown')
+        logger.error("Intel error for %s: %s", system_id, e)
 
 
 @requires_authentication
@@ -529,14 +743,13 @@ async def execute(update: Update, context: ContextTypes.DEFAULT_TYPE):
     system_id = context.args[0].lower()
     command = ' '.join(context.args[1:])
 
-    if system_id not in SYSTEMS:
-        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{system_id}`", parse_mode='Markdown')
+    system = SYSTEMS.get(system_id)
+    if system is None:
+        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{md_code(system_id)}`", parse_mode='Markdown')
         return
 
-    system = SYSTEMS[system_id]
-
     try:
-        container = docker_client.containers.get(system['container'])
+        container = await docker_call(get_container, system['container'])
 
         if container.status != 'running':
             await update.message.reply_text(
@@ -545,23 +758,23 @@ async def execute(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
             return
 
-        result = container.exec_run(command)
+        result = await docker_call(container.exec_run, command)
         output = result.output.decode('utf-8', errors='ignore')
 
         await update.message.reply_text(
             f"⚡ *COMMAND EXECUTED*\n"
             f"━━━━━━━━━━━━━━━━━━━━━\n"
             f"*SYSTEM:* {system['name']}\n"
-            f"*COMMAND:* `{command}`\n\n"
-            f"*OUTPUT:*\n```\n{output[:3500]}\n```",
+            f"*COMMAND:* `{md_code(command)}`\n\n"
+            f"*OUTPUT:*\n```\n{md_code(output[:3500])}\n```",
             parse_mode='Markdown'
         )
 
-        logger.info(f"Command executed on {system_id}: {command}")
+        logger.info("Command executed on %s: %s", system_id, command)
 
     except Exception as e:
-        await update.message.reply_text(f"❌ *EXECUTION ERROR:* `{str(e)}`", parse_mode='Markdown')
-        logger.error(f"Execution error on {system_id}: {e}")
+        await update.message.reply_text(f"❌ *EXECUTION ERROR:* `{md_code(str(e))}`", parse_mode='Markdown')
+        logger.error("Execution error on %s: %s", system_id, e)
 
 
 @requires_authentication
@@ -587,118 +800,65 @@ async def killswitch(update: Update, context: ContextTypes.DEFAULT_TYPE):
         parse_mode='Markdown'
     )
 
-    results = []
-    for system_id in TRADING_SYSTEMS:
-        system = SYSTEMS[system_id]
-        try:
-            container = docker_client.containers.get(system['container'])
-            if container.status == 'running':
-                container.stop(timeout=10)
-                results.append(f"✅ {system['name']} - TERMINATED")
-                logger.warning(f"KILLSWITCH: Terminated {system_id}")
-            else:
-                results.append(f"⚪ {system['name']} - Already offline")
-        except Exception as e:
-            results.append(f"❌ {system['name']} - Error: {str(e)}")
-            logger.error(f"Killswitch error on {system_id}: {e}")
-
-    result_text = "🔴 *KILLSWITCH EXECUTED*\n━━━━━━━━━━━━━━━━━━━━━\n\n"
-    result_text += "\n".join(results)
-    result_text += f"\n\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
-
-    await message.edit_text(result_text, parse_mode='Markdown')
-
-
-@requires_authentication
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Display command reference"""
-    help_text = """🎯 *COMMAND CENTER REFERENCE*
-━━━━━━━━━━━━━━━━━━━━━
-
-*AUTHENTICATION:*
-`/auth <code>` - Authenticate Session
-`/logout` - End Session
-`/status` - Check Session Status
-
-*SITUATION AWARENESS:*
-`/cc` - Command Center (Main Menu)
-`/sitrep` - Full System Status
-`/diagnostics <system>` - Detailed Diagnostics
-
-*SYSTEM CONTROL:*
-`/deploy <system>` - Start System
-`/terminate <system>` - Stop System
-`/reboot <system>` - Restart System
-
-*INTELLIGENCE:*
-`/intel <system> [lines]` - View System Logs
-`/execute <system> <cmd>` - Execute Command
-
-*MASS OPERATIONS:*
-`/deploy_all` - Deploy All Systems
-`/terminate_all` - Shutdown All Systems
-`/reboot_all` - Restart All Systems
-
-*EMERGENCY:*
-`/killswitch CONFIRM` - Emergency Trading Halt
-"""
+    # Stop every trading system at once - worst case is one stop timeout, not the sum
+    results = await asyncio.gather(*(
+        docker_call(killswitch_stop, system_id) for system_id in TRADING_SYSTEMS
+    ))
 
-    if ANALYTICS_AVAILABLE:
-        help_text += """
-*ANALYTICS & TRADING:*
-`/quick` - Quick Status Overview
-`/analytics [bot] [days]` - Full Report
-`/positions [bot]` - Active Positions
-`/trades [bot] [limit]` - Recent Trades
-`/daily [bot] [days]` - Daily Performance
-`/cache` - Redis Cache Stats
-"""
-
-    help_text += """
-━━━━━━━━━━━━━━━━━━━━━
-*SYSTEM IDENTIFIERS:*
-
-Trading Systems:
-  • `alpha` - Multi-Asset Short Seller
-  • `bravo` - LX Algorithm
-  • `charlie` - Momentum Strategy
+    parts = ["🔴 *KILLSWITCH EXECUTED*\n━━━━━━━━━━━━━━━━━━━━━\n\n"]
+    parts.append("\n".join(results))
+    parts.append(f"\n\n⏰ {utc_timestamp()}")
 
-Infrastructure:
-  • `database` - PostgreSQL Core
-  • `cache` - Redis Cache
+    await message.edit_text(''.join(parts), parse_mode='Markdown')
 
-━━━━━━━━━━━━━━━━━━━━━
-*EXAMPLES:*
 
-`/deploy alpha`
-`/intel bravo 100`
-`/diagnostics charlie`
-`/execute alpha ps aux`"""
+def killswitch_stop(system_id):
+    """Stop one trading system for the killswitch (blocking), return its result line"""
+    try:
+        name = CONTAINER_NAMES[system_id]
+        status = get_container_status(name) or inspect_container_status(name)
+        forget_container(name)  # About to change state - don't reuse a cached object
+        if status != 'running':
+            return f"⚪ {SYSTEM_NAMES[system_id]} - Already offline"
+        docker_client.api.stop(name, timeout=10)
+        logger.warning("KILLSWITCH: Terminated %s", system_id)
+        return f"✅ {SYSTEM_NAMES[system_id]} - TERMINATED"
+    except Exception as e:
+        logger.error("Killswitch error on %s: %s", system_id, e)
+        return f"❌ {SYSTEM_NAMES[system_id]} - Error: {md_escape(str(e))}"
 
-    if ANALYTICS_AVAILABLE:
-        help_text += """
-`/analytics alpha 7`
-`/positions bravo`
-`/trades charlie 20`"""
 
-    await update.message.reply_text(help_text, parse_mode='Markdown')
+@requires_authentication
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Display command reference"""
+    await update.message.reply_text(HELP_TEXT, parse_mode='Markdown')
 
 
 # ========================================
 # AUTHENTICATION COMMANDS
 # ========================================
 
+async def delete_after(message, delay):
+    """Delete a message after delay seconds, ignoring already-deleted messages"""
+    await asyncio.sleep(delay)
+    try:
+        await message.delete()
+    except Exception:
+        pass
+
+
 async def auth_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Authenticate user with access code"""
-    user_id = update.effective_user.id
-    username = update.effective_user.username or "Unknown"
+    user = update.effective_user
+    user_id = user.id
+    username = user.username or "Unknown"
 
     # Immediately delete the user's message containing the access code for security
     try:
         await update.message.delete()
-        logger.info(f"🗑️ Deleted auth message from {username} (ID: {user_id})")
+        logger.info("🗑️ Deleted auth message from %s (ID: %s)", username, user_id)
     except Exception as e:
-        logger.warning(f"⚠️ Could not delete auth message: {e}")
+        logger.warning("⚠️ Could not delete auth message: %s", e)
 
     # Check if user is authorized
     if user_id not in ADMIN_IDS:
@@ -709,14 +869,10 @@ async def auth_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                  f"_This message will self-destruct in {MESSAGE_DELETE_DELAY} seconds._",
             parse_mode='Markdown'
         )
-        logger.warning(f"❌ UNAUTHORIZED AUTH ATTEMPT: User {username} (ID: {user_id})")
+        logger.warning("❌ UNAUTHORIZED AUTH ATTEMPT: User %s (ID: %s)", username, user_id)
 
         # Delete the response after configured delay
-        await asyncio.sleep(MESSAGE_DELETE_DELAY)
-        try:
-            await response.delete()
-        except:
-            pass
+        context.application.create_task(delete_after(response, MESSAGE_DELETE_DELAY))
         return
 
     # Check if code was provided
@@ -730,17 +886,14 @@ async def auth_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             parse_mode='Markdown'
         )
         # Delete instruction message after configured delay
-        await asyncio.sleep(MESSAGE_DELETE_DELAY)
-        try:
-            await response.delete()
-        except:
-            pass
+        context.application.create_task(delete_after(response, MESSAGE_DELETE_DELAY))
         return
 
     provided_code = ' '.join(context.args)
 
     # Verify access code
-    if provided_code == ACCESS_CODE:
+    # Constant-time compare; bytes so non-ASCII input can't raise TypeError
+    if hmac.compare_digest(provided_code.encode(), ACCESS_CODE.encode()):
         create_session(user_id)
         response = await context.bot.send_message(
             chat_id=update.effective_chat.id,
@@ -752,14 +905,10 @@ async def auth_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                  f"_This message will self-destruct in {MESSAGE_DELETE_DELAY} seconds._",
             parse_mode='Markdown'
         )
-        logger.info(f"✓ AUTHENTICATION SUCCESS: User {username} (ID: {user_id})")
+        logger.info("✓ AUTHENTICATION SUCCESS: User %s (ID: %s)", username, user_id)
 
         # Delete success message after configured delay
-        await asyncio.sleep(MESSAGE_DELETE_DELAY)
-        try:
-            await response.delete()
-        except:
-            pass
+        context.application.create_task(delete_after(response, MESSAGE_DELETE_DELAY))
     else:
         response = await context.bot.send_message(
             chat_id=update.effective_chat.id,
@@ -769,20 +918,17 @@ async def auth_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                  f"_This message will self-destruct in {MESSAGE_DELETE_DELAY} seconds._",
             parse_mode='Markdown'
         )
-        logger.warning(f"❌ FAILED AUTH ATTEMPT: User {username} (ID: {user_id}) - Wrong code")
+        logger.warning("❌ FAILED AUTH ATTEMPT: User %s (ID: %s) - Wrong code", username, user_id)
 
         # Delete failure message after configured delay
-        await asyncio.sleep(MESSAGE_DELETE_DELAY)
-        try:
-            await response.delete()
-        except:
-            pass
+        context.application.create_task(delete_after(response, MESSAGE_DELETE_DELAY))
 
 
 async def logout_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Logout and end session"""
-    user_id = update.effective_user.id
-    username = update.effective_user.username or "Unknown"
+    user = update.effective_user
+    user_id = user.id
+    username = user.username or "Unknown"
 
     if user_id in active_sessions:
         end_session(user_id)
@@ -802,8 +948,9 @@ async def logout_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Check session status"""
-    user_id = update.effective_user.id
-    username = update.effective_user.username or "Unknown"
+    user = update.effective_user
+    user_id = user.id
+    username = user.username or "Unknown"
 
     if user_id not in ADMIN_IDS:
         await update.message.reply_text(
@@ -813,9 +960,8 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     if is_session_active(user_id):
-        last_activity = active_sessions[user_id]
-        elapsed_minutes = (datetime.now() - last_activity).total_seconds() / 60
-        remaining_minutes = SESSION_TIMEOUT - elapsed_minutes
+        elapsed = time.monotonic() - active_sessions[user_id]
+        remaining_minutes = (SESSION_TIMEOUT_SEC - elapsed) / 60
 
         await update.message.reply_text(
             f"✅ *SESSION ACTIVE*\n\n"
@@ -836,23 +982,28 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # ANALYTICS BUTTON HANDLERS
 # ========================================
 
+class MockUpdate:
+    """Minimal Update stand-in so button taps can reuse the analytics command handlers"""
+    __slots__ = ('message',)
+
+    def __init__(self, message):
+        self.message = message
+
+
+class MockContext:
+    """Minimal context stand-in carrying command arguments"""
+    __slots__ = ('args',)
+
+    def __init__(self, args=()):
+        self.args = list(args)
+
+
 async def handle_analytics_quick(query):
     """Handle quick status button"""
     if not ANALYTICS_AVAILABLE:
-        await query.edit_message_text("⚠️ Analytics not available", parse_mode='Markdown')
+        await query.edit_message_text("⚠️ Analytics not available")
         return
 
-    # Call the quick_status handler with a mock update
-    from analytics_handlers import quick_status
-
-    # Create a message to send response
-    await query.message.reply_text("📊 *Generating Quick Status...*", parse_mode='Markdown')
-
-    # Create a mock update object to pass to the handler
-    class MockUpdate:
-        def __init__(self, message):
-            self.message = message
-
     mock_update = MockUpdate(query.message)
     await quick_status(mock_update, None)
 
@@ -860,21 +1011,9 @@ async def handle_analytics_quick(query):
 async def handle_analytics_full(query):
     """Handle full analytics button"""
     if not ANALYTICS_AVAILABLE:
-        await query.edit_message_text("⚠️ Analytics not available", parse_mode='Markdown')
+        await query.edit_message_text("⚠️ Analytics not available")
         return
 
-    from analytics_handlers import analytics_summary
-
-    await query.message.reply_text("📊 *Generating Full Analytics Report...*", parse_mode='Markdown')
-
-    class MockUpdate:
-        def __init__(self, message):
-            self.message = message
-
-    class MockContext:
-        def __init__(self):
-            self.args = []
-
     mock_update = MockUpdate(query.message)
     mock_context = MockContext()
     await analytics_summary(mock_update, mock_context)
@@ -883,21 +1022,9 @@ async def handle_analytics_full(query):
 async def handle_analytics_positions(query):
     """Handle positions button"""
     if not ANALYTICS_AVAILABLE:
-        await query.edit_message_text("⚠️ Analytics not available", parse_mode='Markdown')
+        await query.edit_message_text("⚠️ Analytics not available")
         return
 
-    from analytics_handlers import positions_summary
-
-    await query.message.reply_text("📍 *Fetching Active Positions...*", parse_mode='Markdown')
-
-    class MockUpdate:
-        def __init__(self, message):
-            self.message = message
-
-    class MockContext:
-        def __init__(self):
-            self.args = []
-
     mock_update = MockUpdate(query.message)
     mock_context = MockContext()
     await positions_summary(mock_update, mock_context)
@@ -906,21 +1033,9 @@ async def handle_analytics_positions(query):
 async def handle_analytics_trades(query):
     """Handle trades button"""
     if not ANALYTICS_AVAILABLE:
-        await query.edit_message_text("⚠️ Analytics not available", parse_mode='Markdown')
+        await query.edit_message_text("⚠️ Analytics not available")
         return
 
-    from analytics_handlers import trades_history
-
-    await query.message.reply_text("📋 *Fetching Recent Trades...*", parse_mode='Markdown')
-
-    class MockUpdate:
-        def __init__(self, message):
-            self.message = message
-
-    class MockContext:
-        def __init__(self):
-            self.args = []
-
     mock_update = MockUpdate(query.message)
     mock_context = MockContext()
     await trades_history(mock_update, mock_context)
@@ -929,21 +1044,9 @@ async def handle_analytics_trades(query):
 async def handle_analytics_daily(query):
     """Handle daily performance button"""
     if not ANALYTICS_AVAILABLE:
-        await query.edit_message_text("⚠️ Analytics not available", parse_mode='Markdown')
+        await query.edit_message_text("⚠️ Analytics not available")
         return
 
-    from analytics_handlers import daily_performance
-
-    await query.message.reply_text("📅 *Generating Daily Performance...*", parse_mode='Markdown')
-
-    class MockUpdate:
-        def __init__(self, message):
-            self.message = message
-
-    class MockContext:
-        def __init__(self):
-            self.args = []
-
     mock_update = MockUpdate(query.message)
     mock_context = MockContext()
     await daily_performance(mock_update, mock_context)
@@ -952,17 +1055,9 @@ async def handle_analytics_daily(query):
 async def handle_analytics_cache(query):
     """Handle cache stats button"""
     if not ANALYTICS_AVAILABLE:
-        await query.edit_message_text("⚠️ Analytics not available", parse_mode='Markdown')
+        await query.edit_message_text("⚠️ Analytics not available")
         return
 
-    from analytics_handlers import cache_stats
-
-    await query.message.reply_text("💾 *Fetching Cache Statistics...*", parse_mode='Markdown')
-
-    class MockUpdate:
-        def __init__(self, message):
-            self.message = message
-
     mock_update = MockUpdate(query.message)
     await cache_stats(mock_update, None)
 
@@ -974,69 +1069,19 @@ async def handle_analytics_cache(query):
 async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle button callbacks from inline keyboards"""
     query = update.callback_query
-    await query.answer()
 
     user_id = query.from_user.id
     if user_id not in ADMIN_IDS:
+        await query.answer("⛔ Access denied")
         await query.edit_message_text("⛔ *ACCESS DENIED*", parse_mode='Markdown')
         return
 
-    data = query.data
-
-    # Main actions
-    if data == 'sitrep':
-        await handle_sitrep_button(query)
-    elif data == 'deploy_all':
-        await handle_deploy_all(query)
-    elif data == 'killswitch':
-        await handle_killswitch_button(query)
-    elif data == 'terminate_all':
-        await handle_terminate_all(query)
-    elif data == 'restart_all':
-        await handle_restart_all(query)
-
-    # Menus
-    elif data == 'menu_trading':
-        await show_trading_menu(query)
-    elif data == 'menu_infrastructure':
-        await show_infrastructure_menu(query)
-    elif data == 'menu_logs':
-        await show_logs_menu(query)
-    elif data == 'menu_analytics':
-        await show_analytics_menu(query)
-    elif data == 'menu_advanced':
-        await show_advanced_menu(query)
+    # Progress goes in the answer toast - it doesn't cost a message edit
+    await query.answer(BUTTON_TOASTS.get(query.data))
 
-    # Analytics actions
-    elif data == 'analytics_quick':
-        await handle_analytics_quick(query)
-    elif data == 'analytics_full':
-        await handle_analytics_full(query)
-    elif data == 'analytics_positions':
-        await handle_analytics_positions(query)
-    elif data == 'analytics_trades':
-        await handle_analytics_trades(query)
-    elif data == 'analytics_daily':
-        await handle_analytics_daily(query)
-    elif data == 'analytics_cache':
-        await handle_analytics_cache(query)
-
-    # System actions
-    elif data.startswith('deploy_'):
-        system_id = data.replace('deploy_', '')
-        await handle_system_action_button(query, system_id, 'deploy')
-    elif data.startswith('terminate_'):
-        system_id = data.replace('terminate_', '')
-        await handle_system_action_button(query, system_id, 'terminate')
-    elif data.startswith('reboot_'):
-        system_id = data.replace('reboot_', '')
-        await handle_system_action_button(query, system_id, 'reboot')
-    elif data.startswith('intel_'):
-        system_id = data.replace('intel_', '')
-        await handle_intel_button(query, system_id)
-    elif data.startswith('diag_'):
-        system_id = data.replace('diag_', '')
-        await handle_diagnostics_button(query, system_id)
+    handler = BUTTON_ROUTES.get(query.data)
+    if handler is not None:
+        await handler(query)
 
 
 # ========================================
@@ -1045,124 +1090,17 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def handle_sitrep_button(query):
     """SITREP via button"""
-    await query.edit_message_text("🔍 *GENERATING SITREP...*", parse_mode='Markdown')
-
-    status_text = "📊 *TACTICAL SITUATION REPORT*\n"
-    status_text += f"━━━━━━━━━━━━━━━━━━━━━\n"
-    status_text += f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
-
-    status_text += "*🎯 TRADING SYSTEMS*\n"
-    trading_operational = 0
-
-    for system_id in TRADING_SYSTEMS:
-        system = SYSTEMS[system_id]
-        status_line, is_running = await get_system_status(system)
-        status_text += status_line
-        if is_running:
-            trading_operational += 1
-
-    status_text += "\n*🔧 INFRASTRUCTURE*\n"
-    infra_operational = 0
-
-    for system_id in INFRASTRUCTURE_SYSTEMS:
-        system = SYSTEMS[system_id]
-        status_line, is_running = await get_system_status(system)
-        status_text += status_line
-        if is_running:
-            infra_operational += 1
-
-    status_text += "\n━━━━━━━━━━━━━━━━━━━━━\n"
-    status_text += f"*OPERATIONAL STATUS:*\n"
-    status_text += f"├─ Trading: {trading_operational}/{len(TRADING_SYSTEMS)}\n"
-    status_text += f"└─ Infrastructure: {infra_operational}/{len(INFRASTRUCTURE_SYSTEMS)}\n"
-
-    total_operational = trading_operational + infra_operational
-    total_systems = len(ALL_SYSTEMS)
-
-    if total_operational == total_systems:
-        status_text += "\n🟢 *ALL SYSTEMS OPERATIONAL*"
-    elif total_operational >= total_systems * 0.7:
-        status_text += "\n🟡 *PARTIAL OPERATIONS*"
-    else:
-        status_text += "\n🔴 *CRITICAL: MULTIPLE SYSTEMS DOWN*"
-
+    status_text = await get_sitrep_text()
     await query.edit_message_text(status_text, parse_mode='Markdown')
 
 
-async def handle_deploy_all(query):
-    """Deploy all systems"""
-    await query.edit_message_text("🚀 *INITIATING MASS DEPLOYMENT...*", parse_mode='Markdown')
-
-    results = []
-    for system_id in ALL_SYSTEMS:
-        system = SYSTEMS[system_id]
-        try:
-            container = docker_client.containers.get(system['container'])
-            if container.status != 'running':
-                container.start()
-                results.append(f"✅ {system['name']}")
-                logger.info(f"Deployed: {system_id}")
-            else:
-                results.append(f"🟢 {system['name']} (Already operational)")
-        except Exception as e:
-            results.append(f"❌ {system['name']}: {str(e)}")
-            logger.error(f"Deploy error {system_id}: {e}")
-
-    result_text = "🚀 *DEPLOYMENT COMPLETE*\n━━━━━━━━━━━━━━━━━━━━━\n\n" + "\n".join(results)
-    await query.edit_message_text(result_text, parse_mode='Markdown')
-
-
-async def handle_terminate_all(query):
-    """Terminate all systems"""
-    await query.edit_message_text("🛑 *INITIATING MASS SHUTDOWN...*", parse_mode='Markdown')
-
-    results = []
-    for system_id in ALL_SYSTEMS:
-        system = SYSTEMS[system_id]
-        try:
-            container = docker_client.containers.get(system['container'])
-            if container.status == 'running':
-                container.stop(timeout=30)
-                results.append(f"✅ {system['name']}")
-                logger.info(f"Terminated: {system_id}")
-            else:
-                results.append(f"⚪ {system['name']} (Already offline)")
-        except Exception as e:
-            results.append(f"❌ {system['name']}: {str(e)}")
-            logger.error(f"Terminate error {system_id}: {e}")
-
-    result_text = "🛑 *SHUTDOWN COMPLETE*\n━━━━━━━━━━━━━━━━━━━━━\n\n" + "\n".join(results)
-    await query.edit_message_text(result_text, parse_mode='Markdown')
-
-
-async def handle_restart_all(query):
-    """Restart all systems"""
-    await query.edit_message_text("🔄 *INITIATING MASS REBOOT...*", parse_mode='Markdown')
-
-    results = []
-    for system_id in ALL_SYSTEMS:
-        system = SYSTEMS[system_id]
-        try:
-            container = docker_client.containers.get(system['container'])
-            container.restart(timeout=30)
-            results.append(f"✅ {system['name']}")
-            logger.info(f"Rebooted: {system_id}")
-        except Exception as e:
-            results.append(f"❌ {system['name']}: {str(e)}")
-            logger.error(f"Reboot error {system_id}: {e}")
-
-    result_text = "🔄 *REBOOT COMPLETE*\n━━━━━━━━━━━━━━━━━━━━━\n\n" + "\n".join(results)
-    await query.edit_message_text(result_text, parse_mode='Markdown')
+async def handle_mass_operation_button(query, operation):
+    """Deploy/terminate/reboot all systems"""
+    await run_mass_operation(operation, query.edit_message_text)
 
 
 async def handle_killswitch_button(query):
     """Killswitch confirmation"""
-    keyboard = [
-        [InlineKeyboardButton("🔴 CONFIRM KILLSWITCH", callback_data='terminate_all')],
-        [InlineKeyboardButton("❌ ABORT", callback_data='sitrep')]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await query.edit_message_text(
         "🔴 *KILLSWITCH ACTIVATION*\n"
         "━━━━━━━━━━━━━━━━━━━━━\n\n"
@@ -1173,75 +1111,34 @@ async def handle_killswitch_button(query):
         "  • Database Core\n"
         "  • Cache Core\n\n"
         "*Confirm to proceed:*",
-        reply_markup=reply_markup,
+        reply_markup=KILLSWITCH_CONFIRM_MARKUP,
         parse_mode='Markdown'
     )
 
 
 async def show_trading_menu(query):
     """Trading systems control panel"""
-    keyboard = []
-
-    for system_id in TRADING_SYSTEMS:
-        system = SYSTEMS[system_id]
-        keyboard.append([
-            InlineKeyboardButton(f"⚡ {system['name']}", callback_data='noop'),
-        ])
-        keyboard.append([
-            InlineKeyboardButton("🚀 Deploy", callback_data=f'deploy_{system_id}'),
-            InlineKeyboardButton("🛑 Terminate", callback_data=f'terminate_{system_id}'),
-            InlineKeyboardButton("🔄 Reboot", callback_data=f'reboot_{system_id}')
-        ])
-        keyboard.append([
-            InlineKeyboardButton("📡 Intel", callback_data=f'intel_{system_id}'),
-            InlineKeyboardButton("🔬 Diagnostics", callback_data=f'diag_{system_id}')
-        ])
-
-    reply_markup = InlineKeyboardMarkup(keyboard)
     await query.edit_message_text(
         "⚡ *TRADING SYSTEMS CONTROL*\n━━━━━━━━━━━━━━━━━━━━━",
-        reply_markup=reply_markup,
+        reply_markup=TRADING_MENU_MARKUP,
         parse_mode='Markdown'
     )
 
 
 async def show_infrastructure_menu(query):
     """Infrastructure control panel"""
-    keyboard = []
-
-    for system_id in INFRASTRUCTURE_SYSTEMS:
-        system = SYSTEMS[system_id]
-        keyboard.append([
-            InlineKeyboardButton(f"🔧 {system['name']}", callback_data='noop'),
-        ])
-        keyboard.append([
-            InlineKeyboardButton("🚀 Deploy", callback_data=f'deploy_{system_id}'),
-            InlineKeyboardButton("🛑 Terminate", callback_data=f'terminate_{system_id}'),
-            InlineKeyboardButton("🔄 Reboot", callback_data=f'reboot_{system_id}')
-        ])
-
-    reply_markup = InlineKeyboardMarkup(keyboard)
     await query.edit_message_text(
         "🔧 *INFRASTRUCTURE CONTROL*\n━━━━━━━━━━━━━━━━━━━━━",
-        reply_markup=reply_markup,
+        reply_markup=INFRASTRUCTURE_MENU_MARKUP,
         parse_mode='Markdown'
     )
 
 
 async def show_logs_menu(query):
     """Logs selection menu"""
-    keyboard = []
-
-    for system_id in ALL_SYSTEMS:
-        system = SYSTEMS[system_id]
-        keyboard.append([
-            InlineKeyboardButton(f"📡 {system['name']}", callback_data=f'intel_{system_id}')
-        ])
-
-    reply_markup = InlineKeyboardMarkup(keyboard)
     await query.edit_message_text(
         "📡 *SYSTEM INTELLIGENCE*\n━━━━━━━━━━━━━━━━━━━━━\n\nSelect system:",
-        reply_markup=reply_markup,
+        reply_markup=LOGS_MENU_MARKUP,
         parse_mode='Markdown'
     )
 
@@ -1257,16 +1154,6 @@ async def show_analytics_menu(query):
         )
         return
 
-    keyboard = [
-        [InlineKeyboardButton("⚡ Quick Status", callback_data='analytics_quick')],
-        [InlineKeyboardButton("📊 Full Analytics Report", callback_data='analytics_full')],
-        [InlineKeyboardButton("📍 Active Positions", callback_data='analytics_positions')],
-        [InlineKeyboardButton("📋 Recent Trades", callback_data='analytics_trades')],
-        [InlineKeyboardButton("📅 Daily Performance", callback_data='analytics_daily')],
-        [InlineKeyboardButton("💾 Cache Stats", callback_data='analytics_cache')],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await query.edit_message_text(
         "📈 *ANALYTICS & REPORTS*\n"
         "━━━━━━━━━━━━━━━━━━━━━\n\n"
@@ -1281,103 +1168,94 @@ async def show_analytics_menu(query):
         "`/analytics alpha 7`\n"
         "`/positions bravo`\n"
         "`/trades charlie 20`",
-        reply_markup=reply_markup,
+        reply_markup=ANALYTICS_MENU_MARKUP,
         parse_mode='Markdown'
     )
 
 
 async def show_advanced_menu(query):
     """Advanced operations menu"""
-    keyboard = [
-        [InlineKeyboardButton("🚀 Deploy All Systems", callback_data='deploy_all')],
-        [InlineKeyboardButton("🛑 Terminate All Systems", callback_data='terminate_all')],
-        [InlineKeyboardButton("🔄 Reboot All Systems", callback_data='restart_all')],
-        [InlineKeyboardButton("🔴 KILLSWITCH", callback_data='killswitch')],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await query.edit_message_text(
         "⚙️ *ADVANCED OPERATIONS*\n━━━━━━━━━━━━━━━━━━━━━\n\n⚠️ Use with caution:",
-        reply_markup=reply_markup,
+        reply_markup=ADVANCED_MENU_MARKUP,
         parse_mode='Markdown'
     )
 
 
 async def handle_system_action_button(query, system_id, action):
     """Handle system action from button"""
-    if system_id not in SYSTEMS:
+    system = SYSTEMS.get(system_id)
+    if system is None:
         await query.edit_message_text(f"❌ Unknown system: {system_id}")
         return
 
-    system = SYSTEMS[system_id]
-
     try:
-        container = docker_client.containers.get(system['container'])
+        name = system['container']
+        status = get_container_status(name) or await docker_call(inspect_container_status, name)
+        forget_container(name)  # About to change state - don't reuse a cached object
 
         if action == 'deploy':
-            if container.status == 'running':
+            if status == 'running':
                 await query.edit_message_text(
                     f"🟢 *{system['name']}*\n\nAlready operational.",
                     parse_mode='Markdown'
                 )
             else:
-                container.start()
+                await docker_call(docker_client.api.start, name)
                 await query.edit_message_text(
                     f"🚀 *DEPLOYED*\n\n{system['name']} is now operational.",
                     parse_mode='Markdown'
                 )
-                logger.info(f"Deployed: {system_id}")
+                logger.info("Deployed: %s", system_id)
 
         elif action == 'terminate':
-            if container.status != 'running':
+            if status != 'running':
                 await query.edit_message_text(
                     f"⚪ *{system['name']}*\n\nAlready offline.",
                     parse_mode='Markdown'
                 )
             else:
-                container.stop(timeout=30)
+                await docker_call(docker_client.api.stop, name, timeout=30)
                 await query.edit_message_text(
                     f"🛑 *TERMINATED*\n\n{system['name']} has been shut down.",
                     parse_mode='Markdown'
                 )
-                logger.info(f"Terminated: {system_id}")
+                logger.info("Terminated: %s", system_id)
 
         elif action == 'reboot':
-            container.restart(timeout=30)
+            if status == 'running':
+                await docker_call(docker_client.api.restart, name, timeout=30)
+            else:
+                # Nothing to stop - skip restart's stop timeout
+                await docker_call(docker_client.api.start, name)
             await query.edit_message_text(
                 f"🔄 *REBOOTED*\n\n{system['name']} has been restarted.",
                 parse_mode='Markdown'
             )
-            logger.info(f"Rebooted: {system_id}")
+            logger.info("Rebooted: %s", system_id)
 
     except Exception as e:
-        await query.edit_message_text(f"❌ *ERROR*\n\n`{str(e)}`", parse_mode='Markdown')
-        logger.error(f"Action error ({action}) on {system_id}: {e}")
+        await query.edit_message_text(f"❌ *ERROR*\n\n`{md_code(str(e))}`", parse_mode='Markdown')
+        logger.error("Action error (%s) on %s: %s", action, system_id, e)
 
 
 async def handle_intel_button(query, system_id):
     """Show system logs via button"""
-    if system_id not in SYSTEMS:
+    system = SYSTEMS.get(system_id)
+    if system is None:
         await query.edit_message_text(f"❌ Unknown system: {system_id}")
         return
 
-    system = SYSTEMS[system_id]
-
     try:
-        container = docker_client.containers.get(system['container'])
-        logs_output = container.logs(tail=50).decode('utf-8', errors='ignore')
-
-        max_length = 3800
-        if len(logs_output) > max_length:
-            logs_output = logs_output[-max_length:]
+        logs_output = await docker_call(fetch_log_tail, system['container'], 50)
 
         await query.edit_message_text(
-            f"📡 *INTEL: {system['name']}*\n━━━━━━━━━━━━━━━━━━━━━\n\n```\n{logs_output}\n```",
+            f"{INTEL_HEADERS[system_id]}```\n{md_code(logs_output)}\n```",
             parse_mode='Markdown'
         )
 
     except Exception as e:
-        await query.edit_message_text(f"❌ *ERROR*\n\n`{str(e)}`", parse_mode='Markdown')
+        await query.edit_message_text(f"❌ *ERROR*\n\n`{md_code(str(e))}`", parse_mode='Markdown')
 
 
 async def handle_diagnostics_button(query, system_id):
@@ -1386,106 +1264,429 @@ async def handle_diagnostics_button(query, system_id):
         await query.edit_message_text(f"❌ Unknown system: {system_id}")
         return
 
-    system = SYSTEMS[system_id]
-
     try:
-        container = docker_client.containers.get(system['container'])
-        status = container.status
-        stats = container.stats(stream=False) if status == 'running' else None
+        diag_text = await get_diagnostics_summary(system_id)
+        await query.edit_message_text(diag_text, parse_mode='Markdown')
+
+    except Exception as e:
+        await query.edit_message_text(f"❌ *ERROR*\n\n`{md_code(str(e))}`", parse_mode='Markdown')
 
-        diag_text = f"🔬 *DIAGNOSTICS: {system['name']}*\n━━━━━━━━━━━━━━━━━━━━━\n\n"
 
-        if status == 'running':
-            diag_text += "🟢 *STATUS:* OPERATIONAL\n\n"
+async def get_diagnostics_summary(system_id):
+    """Diagnostics summary, reusing one built within DIAGNOSTICS_CACHE_SECONDS"""
+    name = CONTAINER_NAMES[system_id]
+    cached = _diagnostics_cache.get(name)
+    if cached is not None and time.monotonic() - cached[0] < DIAGNOSTICS_CACHE_SECONDS:
+        return cached[1]
 
-            if stats:
-                cpu_percent = calculate_cpu_percent(stats)
-                mem_usage = stats['memory_stats'].get('usage', 0) / (1024**2)
-                mem_limit = stats['memory_stats'].get('limit', 0) / (1024**2)
-                mem_percent = (mem_usage / mem_limit * 100) if mem_limit > 0 else 0
+    generation = _status_generation
+    diag_text = await coalesce(('diag', name), lambda: build_diagnostics_summary(system_id))
+    if generation == _status_generation:
+        _diagnostics_cache[name] = (time.monotonic(), diag_text)
+    return diag_text
 
-                diag_text += f"*CPU:* {cpu_percent:.2f}%\n"
-                diag_text += f"*MEMORY:* {mem_usage:.1f}MB / {mem_limit:.1f}MB ({mem_percent:.1f}%)\n"
-        else:
-            diag_text += f"🔴 *STATUS:* {status.upper()}\n"
 
-        await query.edit_message_text(diag_text, parse_mode='Markdown')
+async def build_diagnostics_summary(system_id):
+    """Build the short diagnostics view shown by the diagnostics button"""
+    container = await docker_call(get_container, CONTAINER_NAMES[system_id])
+    status = container.status
+    stats = await docker_call(get_container_stats, container) if status == 'running' else None
 
-    except Exception as e:
-        await query.edit_message_text(f"❌ *ERROR*\n\n`{str(e)}`", parse_mode='Markdown')
+    parts = [DIAGNOSTICS_HEADERS[system_id]]
+
+    if status == 'running':
+        parts.append("🟢 *STATUS:* OPERATIONAL\n\n")
+
+        if stats:
+            cpu_percent = calculate_cpu_percent(stats)
+            mem = stats.get('memory_stats', {})
+            mem_usage = mem.get('usage', 0) * BYTES_TO_MB
+            mem_limit = mem.get('limit', 0) * BYTES_TO_MB
+            mem_percent = (mem_usage / mem_limit * 100) if mem_limit > 0 else 0
+
+            parts.append(f"*CPU:* {cpu_percent:.2f}%\n")
+            parts.append(f"*MEMORY:* {mem_usage:.1f}MB / {mem_limit:.1f}MB ({mem_percent:.1f}%)\n")
+    else:
+        parts.append(f"🔴 *STATUS:* {status.upper()}\n")
+
+    return ''.join(parts)
+
+
+# callback_data -> answer toast shown while the handler works
+BUTTON_TOASTS = {
+    'sitrep': "🔍 Generating SITREP...",
+    'deploy_all': "🚀 Initiating mass deployment...",
+    'terminate_all': "🛑 Initiating mass shutdown...",
+    'restart_all': "🔄 Initiating mass reboot...",
+    'analytics_quick': "📊 Generating Quick Status...",
+    'analytics_full': "📊 Generating Full Analytics Report...",
+    'analytics_positions': "📍 Fetching Active Positions...",
+    'analytics_trades': "📋 Fetching Recent Trades...",
+    'analytics_daily': "📅 Generating Daily Performance...",
+    'analytics_cache': "💾 Fetching Cache Statistics...",
+}
+
+# callback_data -> handler(query)
+BUTTON_ROUTES = {
+    # Main actions
+    'sitrep': handle_sitrep_button,
+    'deploy_all': partial(handle_mass_operation_button, operation='deploy'),
+    'killswitch': handle_killswitch_button,
+    'terminate_all': partial(handle_mass_operation_button, operation='terminate'),
+    'restart_all': partial(handle_mass_operation_button, operation='reboot'),
+
+    # Menus
+    'menu_trading': show_trading_menu,
+    'menu_infrastructure': show_infrastructure_menu,
+    'menu_logs': show_logs_menu,
+    'menu_analytics': show_analytics_menu,
+    'menu_advanced': show_advanced_menu,
+
+    # Analytics actions
+    'analytics_quick': handle_analytics_quick,
+    'analytics_full': handle_analytics_full,
+    'analytics_positions': handle_analytics_positions,
+    'analytics_trades': handle_analytics_trades,
+    'analytics_daily': handle_analytics_daily,
+    'analytics_cache': handle_analytics_cache,
+
+    # System actions - one entry per concrete <action>_<system_id>
+    **{
+        f'{action}_{system_id}': partial(handle_system_action_button, system_id=system_id, action=action)
+        for system_id in ALL_SYSTEMS
+        for action in ('deploy', 'terminate', 'reboot')
+    },
+    **{f'intel_{system_id}': partial(handle_intel_button, system_id=system_id) for system_id in ALL_SYSTEMS},
+    **{f'diag_{system_id}': partial(handle_diagnostics_button, system_id=system_id) for system_id in ALL_SYSTEMS},
+}
 
 
 # ========================================
 # UTILITY FUNCTIONS
 # ========================================
 
-async def get_system_status(system):
-    """Get status line for a system"""
+def md_escape(text):
+    """Escape legacy Markdown entity characters in free text"""
+    return MD_ESCAPE_PATTERN.sub(r'\\\1', text)
+
+
+def md_code(text):
+    """Make arbitrary text safe inside a Markdown code span/block
+
+    A stray backtick in logs or error messages would close the entity early
+    and Telegram rejects the whole message, so swap it for a lookalike.
+    """
+    return text.replace('`', 'ˋ')
+
+
+def decode_log_tail(raw, max_chars):
+    """Decode only the last max_chars characters of a raw log buffer
+
+    UTF-8 needs at most 4 bytes per character, so slicing the bytes first
+    still covers max_chars while skipping the decode of everything before.
+    """
+    return raw[-max_chars * 4:].decode('utf-8', errors='ignore')[-max_chars:]
+
+
+def fetch_log_tail(container_name, lines):
+    """Fetch and decode the displayable tail of a container's logs (blocking)"""
+    raw = get_container(container_name).logs(tail=lines)
+    return decode_log_tail(raw, INTEL_MAX_CHARS)
+
+
+def utc_timestamp():
+    """Current UTC time formatted for report footers/headers"""
+    return datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+
+
+async def coalesce(key, factory):
+    """Run factory() once per key - concurrent callers await the same result"""
+    task = _inflight_requests.get(key)
+    if task is None:
+        task = asyncio.create_task(factory())
+        _inflight_requests[key] = task
+        task.add_done_callback(lambda _: _inflight_requests.pop(key, None))
+    # Shield so one caller's cancellation doesn't cancel the shared work
+    return await asyncio.shield(task)
+
+
+async def get_sitrep_text():
+    """SITREP text, reusing a report generated within SITREP_CACHE_SECONDS"""
+    global _sitrep_cached
+
+    if _sitrep_cached is not None and time.monotonic() - _sitrep_cached[0] < SITREP_CACHE_SECONDS:
+        return _sitrep_cached[1]
+
+    generation = _status_generation
+    status_text = await coalesce('sitrep', build_sitrep_text)
+    # Don't cache a report that a container event has already made stale
+    if generation == _status_generation:
+        _sitrep_cached = (time.monotonic(), status_text)
+    return status_text
+
+
+async def docker_call(func, *args, **kwargs):
+    """Run a blocking docker-py call in a worker thread, bounded by docker_semaphore"""
+    async with docker_semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def get_container(name):
+    """docker_client.containers.get() with a short TTL cache (blocking)"""
+    now = time.monotonic()
+    cached = _container_cache.get(name)
+    if cached is not None and now - cached[0] < CONTAINER_CACHE_SECONDS:
+        return cached[1]
+
+    container = docker_client.containers.get(name)
+    _container_cache[name] = (now, container)
+    return container
+
+
+async def prefetch_container_states():
+    """Re-list container states whenever the events snapshot is missing
+
+    The events watcher drops the snapshot on (re)connect; refilling it here
+    means SITREP and actions read from memory instead of waiting on Docker.
+    """
+    while True:
+        if _container_states is None and _events_connected:
+            try:
+                await get_cached_container_states()
+            except Exception as e:
+                logger.warning("Container state prefetch failed: %s", e)
+        await asyncio.sleep(STATE_PREFETCH_INTERVAL)
+
+
+def get_container_status(name):
+    """Container state from the events snapshot, or None when it isn't known"""
+    states = _container_states
+    return states.get(name) if states is not None else None
+
+
+def inspect_container_status(name):
+    """Container state straight from Docker (blocking)
+
+    Used when the snapshot is cold: Docker answers start-while-running and
+    stop-while-stopped with a silent 304, so acting without knowing the state
+    would report a change that never happened.
+    """
+    return docker_client.api.inspect_container(name)['State']['Status']
+
+
+def forget_container(name):
+    """Drop a cached container object so the next lookup re-inspects it"""
+    _container_cache.pop(name, None)
+
+
+def invalidate_status_cache(container_name):
+    """Drop cached status for a container (called on Docker container events)"""
+    global _sitrep_cached, _status_generation
+    _status_generation += 1
+    _sitrep_cached = None
+    _diagnostics_cache.pop(container_name, None)
+    _cpu_samples.pop(container_name, None)  # CPU counters restart with the container
+    forget_container(container_name)
+
+
+def watch_container_events():
+    """Invalidate cached status whenever a managed container changes state
+
+    Blocks on the Docker /events stream, so it runs in a daemon thread.
+    Reconnects after a short pause if the stream drops.
+    """
+    global _container_states, _events_connected, _status_generation
+
+    while True:
+        try:
+            events = docker_client.events(
+                decode=True,
+                filters={'type': 'container', 'event': list(CONTAINER_STATE_EVENTS)}
+            )
+            # Anything may have changed while disconnected - start from a fresh listing,
+            # and bump the generation so a listing begun before the drop isn't stored
+            _container_states = None
+            _status_generation += 1
+            _events_connected = True
+            for event in events:
+                name = event.get('Actor', {}).get('Attributes', {}).get('name')
+                if name in MANAGED_CONTAINERS:
+                    invalidate_status_cache(name)
+                    apply_container_event(name, event.get('Action'))
+        except Exception as e:
+            logger.error("Docker event stream error: %s", e)
+        _events_connected = False
+        _container_states = None
+        _status_generation += 1
+        time.sleep(EVENT_RECONNECT_DELAY)
+
+
+def apply_container_event(name, action):
+    """Update the container state snapshot from one Docker event"""
+    states = _container_states
+    if states is None:
+        return
+    if action == 'destroy':
+        states.pop(name, None)
+    elif action in EVENT_CONTAINER_STATES:
+        states[name] = EVENT_CONTAINER_STATES[action]
+
+
+async def get_cached_container_states():
+    """Container states from the event-maintained snapshot, listing only when there is none"""
+    global _container_states
+
+    if _container_states is not None:
+        return _container_states
+
+    generation = _status_generation
+    states = await docker_call(get_container_states)
+    # Only trust the listing while events keep it current and none arrived mid-call
+    if _events_connected and generation == _status_generation:
+        _container_states = states
+    return states
+
+
+async def build_sitrep_text():
+    """Build the full tactical situation report"""
+    # Event-maintained snapshot; at most one /containers/json call covers every system
     try:
-        container = docker_client.containers.get(system['container'])
-        status = container.status
+        container_states = await get_cached_container_states()
+    except Exception as e:
+        logger.error("SITREP container listing failed: %s", e)
+        container_states = None
+
+    parts = [
+        "📊 *TACTICAL SITUATION REPORT*\n━━━━━━━━━━━━━━━━━━━━━\n",
+        f"⏰ {utc_timestamp()}\n\n",
+        # Trading Systems Status
+        "*🎯 TRADING SYSTEMS*\n",
+    ]
+    trading_operational = 0
 
-        if status == 'running':
-            emoji = "🟢"
-            status_text = "OPERATIONAL"
-            is_running = True
-        elif status == 'exited':
-            emoji = "🔴"
-            status_text = "OFFLINE"
-            is_running = False
-        else:
-            emoji = "🟡"
-            status_text = status.upper()
-            is_running = False
+    for system_id in TRADING_SYSTEMS:
+        status_line, is_running = get_system_status(system_id, container_states)
+        parts.append(status_line)
+        if is_running:
+            trading_operational += 1
 
-        return f"{emoji} {system['name']}: {status_text}\n", is_running
+    # Infrastructure Status
+    parts.append("\n*🔧 INFRASTRUCTURE*\n")
+    infra_operational = 0
+
+    for system_id in INFRASTRUCTURE_SYSTEMS:
+        status_line, is_running = get_system_status(system_id, container_states)
+        parts.append(status_line)
+        if is_running:
+            infra_operational += 1
+
+    # Overall Status Summary
+    parts.append(
+        "\n━━━━━━━━━━━━━━━━━━━━━\n*OPERATIONAL STATUS:*\n"
+        f"├─ Trading: {trading_operational}/{N_TRADING}\n"
+        f"└─ Infrastructure: {infra_operational}/{N_INFRA}\n"
+    )
+
+    # Overall health
+    total_operational = trading_operational + infra_operational
+
+    if total_operational == N_ALL:
+        parts.append("\n🟢 *ALL SYSTEMS OPERATIONAL*")
+    elif total_operational >= PARTIAL_THRESHOLD:
+        parts.append("\n🟡 *PARTIAL OPERATIONS*")
+    else:
+        parts.append("\n🔴 *CRITICAL: MULTIPLE SYSTEMS DOWN*")
+
+    return ''.join(parts)
 
-    except docker.errors.NotFound:
-        return f"⚪ {system['name']}: NOT DEPLOYED\n", False
+
+def get_container_states():
+    """Map container name -> state for every container in one daemon call"""
+    return {
+        name.lstrip('/'): container['State']
+        for container in docker_client.api.containers(all=True)
+        for name in container['Names']
+    }
+
+
+def get_system_status(system_id, container_states):
+    """Get status line for a system from a get_container_states() snapshot"""
+    if container_states is None:
+        # Docker couldn't be queried - report rather than fail the whole SITREP
+        return f"🟡 {SYSTEM_NAMES[system_id]}: UNKNOWN\n", False
+
+    status = container_states.get(CONTAINER_NAMES[system_id])
+
+    if status is None:
+        return f"⚪ {SYSTEM_NAMES[system_id]}: NOT DEPLOYED\n", False
+
+    if status == 'running':
+        emoji = "🟢"
+        status_text = "OPERATIONAL"
+        is_running = True
+    elif status == 'exited':
+        emoji = "🔴"
+        status_text = "OFFLINE"
+        is_running = False
+    else:
+        emoji = "🟡"
+        status_text = status.upper()
+        is_running = False
+
+    return f"{emoji} {SYSTEM_NAMES[system_id]}: {status_text}\n", is_running
 
 
 async def execute_system_action(update, system_id, action):
     """Execute system action (deploy/terminate/reboot)"""
-    system = SYSTEMS[system_id]
+    system = SYSTEMS.get(system_id)
+    if system is None:
+        await update.message.reply_text(f"❌ *UNKNOWN SYSTEM:* `{md_code(system_id)}`", parse_mode='Markdown')
+        return
 
     try:
-        container = docker_client.containers.get(system['container'])
+        name = system['container']
+        status = get_container_status(name) or await docker_call(inspect_container_status, name)
+        forget_container(name)  # About to change state - don't reuse a cached object
 
         if action == 'deploy':
-            if container.status == 'running':
+            if status == 'running':
                 await update.message.reply_text(
                     f"🟢 *{system['name']}* is already operational.",
                     parse_mode='Markdown'
                 )
             else:
-                container.start()
+                await docker_call(docker_client.api.start, name)
                 await update.message.reply_text(
                     f"🚀 *DEPLOYED*\n\n{system['name']} is now operational.",
                     parse_mode='Markdown'
                 )
-                logger.info(f"Deployed: {system_id}")
+                logger.info("Deployed: %s", system_id)
 
         elif action == 'terminate':
-            if container.status != 'running':
+            if status != 'running':
                 await update.message.reply_text(
                     f"⚪ *{system['name']}* is already offline.",
                     parse_mode='Markdown'
                 )
             else:
-                container.stop(timeout=30)
+                await docker_call(docker_client.api.stop, name, timeout=30)
                 await update.message.reply_text(
                     f"🛑 *TERMINATED*\n\n{system['name']} has been shut down.",
                     parse_mode='Markdown'
                 )
-                logger.info(f"Terminated: {system_id}")
+                logger.info("Terminated: %s", system_id)
 
         elif action == 'reboot':
-            container.restart(timeout=30)
+            if status == 'running':
+                await docker_call(docker_client.api.restart, name, timeout=30)
+            else:
+                # Nothing to stop - skip restart's stop timeout
+                await docker_call(docker_client.api.start, name)
             await update.message.reply_text(
                 f"🔄 *REBOOTED*\n\n{system['name']} has been restarted.",
                 parse_mode='Markdown'
             )
-            logger.info(f"Rebooted: {system_id}")
+            logger.info("Rebooted: %s", system_id)
 
     except docker.errors.NotFound:
         await update.message.reply_text(
@@ -1493,23 +1694,36 @@ async def execute_system_action(update, system_id, action):
             parse_mode='Markdown'
         )
     except Exception as e:
-        await update.message.reply_text(f"❌ *ERROR:* `{str(e)}`", parse_mode='Markdown')
-        logger.error(f"Action error ({action}) on {system_id}: {e}")
+        await update.message.reply_text(f"❌ *ERROR:* `{md_code(str(e))}`", parse_mode='Markdown')
+        logger.error("Action error (%s) on %s: %s", action, system_id, e)
+
+
+def get_container_stats(container):
+    """container.stats() snapshot, one-shot once a previous CPU sample is known (blocking)
+
+    A plain stream=False read makes the daemon wait for a second sample to fill
+    precpu_stats; with a remembered sample the one-shot snapshot is enough.
+    """
+    previous = _cpu_samples.get(container.name)
+    if previous is None:
+        stats = container.stats(stream=False)
+    else:
+        stats = container.stats(stream=False, one_shot=True)
+        stats['precpu_stats'] = previous
+    _cpu_samples[container.name] = stats.get('cpu_stats')
+    return stats
 
 
 def calculate_cpu_percent(stats):
     """Calculate CPU percentage from container stats"""
-    try:
-        cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                    stats['precpu_stats']['cpu_usage']['total_usage']
-        system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                       stats['precpu_stats']['system_cpu_usage']
-        cpu_count = stats['cpu_stats']['online_cpus']
-
-        if system_delta > 0 and cpu_delta > 0:
-            return (cpu_delta / system_delta) * cpu_count * 100.0
-    except:
-        pass
+    cpu = stats.get('cpu_stats') or {}
+    precpu = stats.get('precpu_stats') or {}
+
+    cpu_delta = cpu.get('cpu_usage', {}).get('total_usage', 0) - precpu.get('cpu_usage', {}).get('total_usage', 0)
+    system_delta = cpu.get('system_cpu_usage', 0) - precpu.get('system_cpu_usage', 0)
+
+    if system_delta > 0 and cpu_delta > 0:
+        return (cpu_delta / system_delta) * cpu.get('online_cpus', 1) * 100.0
     return 0.0
 
 
@@ -1520,64 +1734,88 @@ def calculate_cpu_percent(stats):
 @requires_authentication
 async def deploy_all_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Deploy all systems via command"""
-    message = await update.message.reply_text("🚀 *INITIATING MASS DEPLOYMENT...*", parse_mode='Markdown')
-
-    results = []
-    for system_id in ALL_SYSTEMS:
-        system = SYSTEMS[system_id]
-        try:
-            container = docker_client.containers.get(system['container'])
-            if container.status != 'running':
-                container.start()
-                results.append(f"✅ {system['name']}")
-            else:
-                results.append(f"🟢 {system['name']} (Already operational)")
-        except Exception as e:
-            results.append(f"❌ {system['name']}: {str(e)}")
-
-    result_text = "🚀 *DEPLOYMENT COMPLETE*\n━━━━━━━━━━━━━━━━━━━━━\n\n" + "\n".join(results)
-    await message.edit_text(result_text, parse_mode='Markdown')
+    message = await update.message.reply_text(MASS_OPERATIONS['deploy']['progress'], parse_mode='Markdown')
+    await run_mass_operation('deploy', message.edit_text)
 
 
 @requires_authentication
 async def terminate_all_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Terminate all systems via command"""
-    message = await update.message.reply_text("🛑 *INITIATING MASS SHUTDOWN...*", parse_mode='Markdown')
-
-    results = []
-    for system_id in ALL_SYSTEMS:
-        system = SYSTEMS[system_id]
-        try:
-            container = docker_client.containers.get(system['container'])
-            if container.status == 'running':
-                container.stop(timeout=30)
-                results.append(f"✅ {system['name']}")
-            else:
-                results.append(f"⚪ {system['name']} (Already offline)")
-        except Exception as e:
-            results.append(f"❌ {system['name']}: {str(e)}")
-
-    result_text = "🛑 *SHUTDOWN COMPLETE*\n━━━━━━━━━━━━━━━━━━━━━\n\n" + "\n".join(results)
-    await message.edit_text(result_text, parse_mode='Markdown')
+    message = await update.message.reply_text(MASS_OPERATIONS['terminate']['progress'], parse_mode='Markdown')
+    await run_mass_operation('terminate', message.edit_text)
 
 
 @requires_authentication
 async def reboot_all_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Reboot all systems via command"""
-    message = await update.message.reply_text("🔄 *INITIATING MASS REBOOT...*", parse_mode='Markdown')
+    message = await update.message.reply_text(MASS_OPERATIONS['reboot']['progress'], parse_mode='Markdown')
+    await run_mass_operation('reboot', message.edit_text)
 
-    results = []
-    for system_id in ALL_SYSTEMS:
-        system = SYSTEMS[system_id]
-        try:
-            container = docker_client.containers.get(system['container'])
-            container.restart(timeout=30)
-            results.append(f"✅ {system['name']}")
-        except Exception as e:
-            results.append(f"❌ {system['name']}: {str(e)}")
 
-    result_text = "🔄 *REBOOT COMPLETE*\n━━━━━━━━━━━━━━━━━━━━━\n\n" + "\n".join(results)
-    await message.edit_text(result_text, parse_mode='Markdown')
+async def run_mass_operation(operation, edit):
+    """Apply a MASS_OPERATIONS entry to every system concurrently
+
+    edit is the message's edit coroutine; the report is updated as systems
+    finish, at most once per MASS_PROGRESS_EDIT_INTERVAL, then finalised.
+    """
+    op = MASS_OPERATIONS[operation]
+
+    async def run(system_id):
+        return system_id, await docker_call(run_container_operation, system_id, operation)
+
+    results = {}
+    last_edit = time.monotonic()
+    for next_result in asyncio.as_completed([run(system_id) for system_id in ALL_SYSTEMS]):
+        system_id, line = await next_result
+        results[system_id] = line
+
+        if len(results) < N_ALL and time.monotonic() - last_edit >= MASS_PROGRESS_EDIT_INTERVAL:
+            try:
+                await edit(render_mass_report(op['progress'], results), parse_mode='Markdown')
+            except Exception as e:
+                # A dropped progress update is harmless - the final report still lands
+                logger.warning("Mass %s progress update failed: %s", operation, e)
+            last_edit = time.monotonic()
+
+    await edit(render_mass_report(op['complete'], results), parse_mode='Markdown')
+
+
+def render_mass_report(title, results):
+    """Mass operation report in system order, pending systems marked as such"""
+    lines = (results.get(system_id, f"⏳ {SYSTEM_NAMES[system_id]}") for system_id in ALL_SYSTEMS)
+    return MASS_REPORT_HEADERS[title] + "\n".join(lines)
+
+
+def run_container_operation(system_id, operation):
+    """Deploy/terminate/reboot one system for a mass operation (blocking)"""
+    name = SYSTEM_NAMES[system_id]
+    container_name = CONTAINER_NAMES[system_id]
+    op = MASS_OPERATIONS[operation]
+
+    try:
+        # Reboot restarts whatever the state, so only deploy/terminate need to know it
+        status = None
+        if operation != 'reboot':
+            status = get_container_status(container_name) or inspect_container_status(container_name)
+        forget_container(container_name)  # About to change state - don't reuse a cached object
+
+        if operation == 'deploy':
+            if status == 'running':
+                return f"🟢 {name} (Already operational)"
+            docker_client.api.start(container_name)
+        elif operation == 'terminate':
+            if status != 'running':
+                return f"⚪ {name} (Already offline)"
+            docker_client.api.stop(container_name, timeout=30)
+        else:
+            docker_client.api.restart(container_name, timeout=30)
+
+        logger.info("%s: %s", op['done_log'], system_id)
+        return f"✅ {name}"
+
+    except Exception as e:
+        logger.error("%s %s: %s", op['error_log'], system_id, e)
+        return f"❌ {name}: {md_escape(str(e))}"
 
 
 # ========================================
@@ -1599,11 +1837,20 @@ def main():
     logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     logger.info("🎯 ALPHA COMMAND CENTER - INITIALIZING")
     logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    logger.info(f"✓ Authorized operators: {len(ADMIN_IDS)}")
-    logger.info(f"✓ Systems under control: {len(ALL_SYSTEMS)}")
+    logger.info("✓ Authorized operators: %s", len(ADMIN_IDS))
+    logger.info("✓ Systems under control: %s", N_ALL)
 
     # Create application
-    application = Application.builder().token(BOT_TOKEN).build()
+    # Handlers are I/O bound and Docker calls are bounded by docker_semaphore,
+    # so process updates concurrently instead of one at a time
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .concurrent_updates(UPDATE_CONCURRENCY)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
     # Authentication handlers (no session required)
     application.add_handler(CommandHandler("auth", auth_command))
@@ -1639,6 +1886,9 @@ def main():
     # Callback handlers
     application.add_handler(CallbackQueryHandler(button_callback))
 
+    # Keep cached status fresh from Docker container events
+    threading.Thread(target=watch_container_events, name='docker-events', daemon=True).start()
+
     # Start bot
     logger.info("✓ Command Center operational")
     logger.info("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
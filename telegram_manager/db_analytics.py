@@ -2,33 +2,428 @@
 """
 Database Analytics Module for Telegram Command Center - PRODUCTION VERSION
 Queries the production fills-based schema (not the unified trades schema)
+Expects the covering indexes from database/migrations/005_add_analytics_covering_indexes.sql
 """
 
 import os
+import re
+import json
+import inspect
+import time
 import logging
-from datetime import datetime, timedelta
+import threading
+from functools import wraps
+from datetime import date, datetime
 from typing import Dict, List, Optional, Tuple
-from decimal import Decimal
 
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.pool import ThreadedConnectionPool
+    from psycopg2.extensions import connection as PgConnection, new_type, register_type
     import redis
 except ImportError:
     psycopg2 = None
     redis = None
+    PgConnection = object
+    new_type = None
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL NUMERIC (oid 1700) parsed straight to float
+NUMERIC_AS_FLOAT = new_type(
+    (1700,), 'NUMERIC_AS_FLOAT', lambda value, cursor: float(value) if value is not None else None
+) if new_type else None
+
+# PostgreSQL connection pool bounds (handlers may query concurrently);
+# keep PG_POOL_MAX at or below the PgBouncer pool size when going through one
+PG_POOL_MIN_CONN = 2
+PG_POOL_MAX_CONN = int(os.getenv('PG_POOL_MAX', 10))
+
+# Ceiling for the exponential backoff between PostgreSQL connect attempts
+PG_RETRY_MAX_SECONDS = 60
+
+# psycopg2 %s placeholders, rewritten to $1..$n for PREPARE
+PLACEHOLDER_PATTERN = re.compile(r'%s')
+
+# Rows fetched per round-trip when streaming through a server-side cursor
+STREAM_ITERSIZE = 200
+
+# Redis cache-aside key namespace (bump the version when cached shapes change)
+CACHE_KEY_PREFIX = 'v2:analytics'
+
+# get_recent_trades limits worth caching (the /trades default and round presets)
+RECENT_TRADES_CACHED_LIMITS = frozenset({10, 25, 50})
+
+# In-process cache in front of Redis for repeat reads within a couple of seconds
+L1_CACHE_SECONDS = 2
+L1_CACHE_MAX_ENTRIES = 256
+
+
+def _encode_cached(value):
+    """json.dumps default= hook keeping datetime/date types through the cache"""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"Cannot cache {type(value).__name__}")
+
+
+def _decode_cached(obj):
+    """json.loads object_hook reversing _encode_cached"""
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+def redis_cached(name: str, ttl: int):
+    """Cache a DatabaseAnalytics method's result in Redis for ttl seconds, keyed by its arguments
+
+    Keys look like v2:analytics:<name>:<bot_id or all>:<days>, with defaults filled
+    in, so get_fills_count('x'), get_fills_count('x', 7) and get_fills_count(bot_id='x')
+    share one entry and v2:analytics:<name>:* matches every variant of a method.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            parts = [CACHE_KEY_PREFIX, name]
+            parts.extend('all' if arg is None else str(arg) for arg in bound.args[1:])
+            return self._cached(':'.join(parts), ttl, lambda: method(*bound.args))
+        return wrapper
+    return decorator
+
+
+def _fetch_one_as_dict(cursor) -> Dict:
+    """Fetch one row from a tuple cursor as {column: value}"""
+    row = cursor.fetchone()
+    if row is None:
+        return {}
+    return {column.name: value for column, value in zip(cursor.description, row)}
+
+
+def _fetch_all_as_dicts(cursor) -> List[Dict]:
+    """Fetch every row from a tuple cursor as {column: value}, reading column names once"""
+    rows = iter(cursor)
+    first = next(rows, None)
+    if first is None:
+        return []
+    # Named cursors only fill in description once the first batch has arrived
+    columns = [column.name for column in cursor.description]
+    result = [dict(zip(columns, first))]
+    result.extend(dict(zip(columns, row)) for row in rows)
+    return result
+
+
+# Analytics queries, built once at import; each *_ONE/*_ALL pair is picked by bot_id
+
+SQL_PORTFOLIO_SUMMARY = """
+    SELECT
+        COUNT(DISTINCT bot_id) as total_bots,
+        SUM(current_equity) as total_equity,
+        SUM(initial_capital) as total_capital,
+        COUNT(*) FILTER (WHERE status = 'active') as active_bots,
+        COUNT(*) FILTER (WHERE status = 'paused') as paused_bots
+    FROM trading.bots;
+"""
+
+SQL_BOT_SUMMARY_ONE = """
+    SELECT
+        bot_id,
+        bot_name,
+        bot_type,
+        status,
+        initial_capital,
+        current_equity,
+        ROUND((current_equity - initial_capital) / initial_capital * 100, 2) as return_pct,
+        last_heartbeat
+    FROM trading.bots
+    WHERE bot_id = %s;
+"""
+
+SQL_BOT_SUMMARY_ALL = """
+    SELECT
+        bot_id,
+        bot_name,
+        bot_type,
+        status,
+        initial_capital,
+        current_equity,
+        ROUND((current_equity - initial_capital) / initial_capital * 100, 2) as return_pct,
+        last_heartbeat
+    FROM trading.bots
+    ORDER BY bot_type, bot_id;
+"""
+
+SQL_TRADING_SUMMARY_ONE = """
+    WITH p AS (
+        -- Bound once, read by both branches below
+        SELECT %s::varchar AS bot_id, NOW() - make_interval(days => %s) AS since
+    ),
+    window_fills AS (
+        SELECT bot_id, symbol, side, exec_time
+        FROM trading.fills
+        WHERE bot_id = (SELECT bot_id FROM p) AND exec_time >= (SELECT since FROM p)
+    ),
+    trade_stats AS (
+        SELECT
+            MAX(bot_id) as bot_id,
+            COUNT(*) as total_trades,
+            COUNT(*) FILTER (WHERE net_pnl > 0) as winning_trades,
+            COUNT(*) FILTER (WHERE net_pnl <= 0) as losing_trades,
+            COUNT(*) as closed_trades,
+            ROUND(SUM(net_pnl), 2) as total_pnl,
+            ROUND(AVG(net_pnl), 2) as avg_pnl,
+            ROUND(MAX(net_pnl), 2) as max_win,
+            ROUND(MIN(net_pnl), 2) as max_loss,
+            ROUND(SUM(total_commission), 2) as total_fees,
+            COALESCE(ROUND(
+                100.0 * COUNT(*) FILTER (WHERE net_pnl > 0) / NULLIF(COUNT(*), 0), 2
+            ), 0) as win_rate
+        FROM trading.completed_trades
+        WHERE bot_id = (SELECT bot_id FROM p) AND exit_time >= (SELECT since FROM p)
+    )
+    SELECT
+        trade_stats.*,
+        trade_stats.total_trades as filled_trades,
+        (SELECT COUNT(*) FILTER (WHERE side = 'Buy')
+         FROM (
+             -- Latest fill per (bot, symbol); a Buy there is still open
+             SELECT DISTINCT ON (bot_id, symbol) side
+             FROM window_fills
+             ORDER BY bot_id, symbol, exec_time DESC
+         ) latest) as open_trades,
+        (SELECT COUNT(*) FROM window_fills) as fill_count
+    FROM trade_stats;
+"""
+
+SQL_TRADING_SUMMARY_ALL = """
+    WITH p AS (
+        -- Bound once, read by both branches below
+        SELECT NOW() - make_interval(days => %s) AS since
+    ),
+    window_fills AS (
+        SELECT bot_id, symbol, side, exec_time
+        FROM trading.fills
+        WHERE exec_time >= (SELECT since FROM p)
+    ),
+    trade_stats AS (
+        SELECT
+            COUNT(*) as total_trades,
+            COUNT(*) FILTER (WHERE net_pnl > 0) as winning_trades,
+            COUNT(*) FILTER (WHERE net_pnl <= 0) as losing_trades,
+            COUNT(*) as closed_trades,
+            ROUND(SUM(net_pnl), 2) as total_pnl,
+            ROUND(AVG(net_pnl), 2) as avg_pnl,
+            ROUND(MAX(net_pnl), 2) as max_win,
+            ROUND(MIN(net_pnl), 2) as max_loss,
+            ROUND(SUM(total_commission), 2) as total_fees,
+            COALESCE(ROUND(
+                100.0 * COUNT(*) FILTER (WHERE net_pnl > 0) / NULLIF(COUNT(*), 0), 2
+            ), 0) as win_rate
+        FROM trading.completed_trades
+        WHERE exit_time >= (SELECT since FROM p)
+    )
+    SELECT
+        trade_stats.*,
+        trade_stats.total_trades as filled_trades,
+        (SELECT COUNT(*) FILTER (WHERE side = 'Buy')
+         FROM (
+             -- Latest fill per (bot, symbol); a Buy there is still open
+             SELECT DISTINCT ON (bot_id, symbol) side
+             FROM window_fills
+             ORDER BY bot_id, symbol, exec_time DESC
+         ) latest) as open_trades,
+        (SELECT COUNT(*) FROM window_fills) as fill_count
+    FROM trade_stats;
+"""
+
+SQL_ACTIVE_POSITIONS_ONE = """
+    SELECT
+        bot_id,
+        symbol,
+        side,
+        size,
+        avg_entry_price,
+        updated_at as opened_at
+    FROM trading.positions
+    WHERE bot_id = %s AND size > 0
+    ORDER BY updated_at DESC;
+"""
+
+SQL_ACTIVE_POSITIONS_ALL = """
+    SELECT
+        bot_id,
+        symbol,
+        side,
+        size,
+        avg_entry_price,
+        updated_at as opened_at
+    FROM trading.positions
+    WHERE size > 0
+    ORDER BY bot_id, updated_at DESC;
+"""
+
+SQL_RECENT_TRADES_ONE = """
+    SELECT
+        bot_id,
+        symbol,
+        entry_side as side,
+        entry_time,
+        exit_time,
+        entry_price,
+        exit_price,
+        entry_qty as quantity,
+        net_pnl as pnl_usd,
+        pnl_pct,
+        exit_reason,
+        'filled' as status
+    FROM trading.completed_trades
+    WHERE bot_id = %s
+    ORDER BY exit_time DESC
+    LIMIT %s;
+"""
+
+SQL_RECENT_TRADES_ALL = """
+    SELECT
+        bot_id,
+        symbol,
+        entry_side as side,
+        entry_time,
+        exit_time,
+        entry_price,
+        exit_price,
+        entry_qty as quantity,
+        net_pnl as pnl_usd,
+        pnl_pct,
+        exit_reason,
+        'filled' as status
+    FROM trading.completed_trades
+    ORDER BY exit_time DESC
+    LIMIT %s;
+"""
+
+SQL_DAILY_PERFORMANCE_ONE = """
+    SELECT
+        DATE(exit_time) as trade_date,
+        COUNT(*) as trades,
+        COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
+        COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
+        ROUND(SUM(net_pnl), 2) as daily_pnl,
+        ROUND(AVG(net_pnl), 2) as avg_pnl
+    FROM trading.completed_trades
+    WHERE bot_id = %s AND exit_time >= NOW() - make_interval(days => %s)
+    GROUP BY DATE(exit_time)
+    ORDER BY trade_date DESC;
+"""
+
+SQL_DAILY_PERFORMANCE_ALL = """
+    SELECT
+        DATE(exit_time) as trade_date,
+        COUNT(*) as trades,
+        COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
+        COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
+        ROUND(SUM(net_pnl), 2) as daily_pnl,
+        ROUND(AVG(net_pnl), 2) as avg_pnl
+    FROM trading.completed_trades
+    WHERE exit_time >= NOW() - make_interval(days => %s)
+    GROUP BY DATE(exit_time)
+    ORDER BY trade_date DESC;
+"""
+
+SQL_EXIT_REASONS_ONE = """
+    SELECT
+        exit_reason,
+        COUNT(*) as count,
+        COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
+        COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
+        ROUND(SUM(net_pnl), 2) as total_pnl,
+        ROUND(AVG(net_pnl), 2) as avg_pnl,
+        ROUND(AVG(holding_duration_seconds) / 60, 2) as avg_holding_minutes
+    FROM trading.completed_trades
+    WHERE bot_id = %s AND exit_time >= NOW() - make_interval(days => %s)
+    GROUP BY exit_reason
+    ORDER BY count DESC;
+"""
+
+SQL_EXIT_REASONS_ALL = """
+    SELECT
+        exit_reason,
+        COUNT(*) as count,
+        COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
+        COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
+        ROUND(SUM(net_pnl), 2) as total_pnl,
+        ROUND(AVG(net_pnl), 2) as avg_pnl,
+        ROUND(AVG(holding_duration_seconds) / 60, 2) as avg_holding_minutes
+    FROM trading.completed_trades
+    WHERE exit_time >= NOW() - make_interval(days => %s)
+    GROUP BY exit_reason
+    ORDER BY count DESC;
+"""
+
+SQL_FILLS_STATS_ONE = """
+    SELECT
+        COUNT(*) as total_fills,
+        COUNT(*) FILTER (WHERE side = 'Buy') as buy_fills,
+        COUNT(*) FILTER (WHERE side = 'Sell') as sell_fills,
+        ROUND(SUM(commission), 2) as total_fees,
+        COUNT(DISTINCT symbol) as symbols_traded
+    FROM trading.fills
+    WHERE bot_id = %s AND exec_time >= NOW() - make_interval(days => %s);
+"""
+
+SQL_FILLS_STATS_ALL = """
+    SELECT
+        COUNT(*) as total_fills,
+        COUNT(*) FILTER (WHERE side = 'Buy') as buy_fills,
+        COUNT(*) FILTER (WHERE side = 'Sell') as sell_fills,
+        ROUND(SUM(commission), 2) as total_fees,
+        COUNT(DISTINCT symbol) as symbols_traded
+    FROM trading.fills
+    WHERE exec_time >= NOW() - make_interval(days => %s);
+"""
+
+
+class PreparingConnection(PgConnection):
+    """psycopg2 connection that remembers which statements it has PREPAREd
+
+    NUMERIC columns come back as float rather than Decimal - every analytics
+    value is only ever rounded for display, and floats go straight into json.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+        register_type(NUMERIC_AS_FLOAT, self)
+
 
 class DatabaseAnalytics:
     """Analytics interface for PostgreSQL (fills-based) and Redis databases"""
 
     def __init__(self):
         """Initialize database connections"""
-        self.pg_conn = None
+        self.pg_pool = None
         self.redis_client = None
 
+        # PostgreSQL reconnect backoff: after a failed connect, queries return
+        # empty until _pg_next_retry instead of re-dialling on every message
+        self._pg_connect_lock = threading.Lock()
+        self._pg_failures = 0
+        self._pg_next_retry = 0.0
+
+        # ThreadedConnectionPool raises PoolError instead of waiting when every
+        # connection is out, so borrowers queue here for a free slot first
+        self._pg_slots = threading.BoundedSemaphore(PG_POOL_MAX_CONN)
+
+        # L1 cache: {key: (expires_at_monotonic, value)}, shared across handler threads
+        self._l1_cache = {}
+        self._l1_lock = threading.Lock()
+
         # PostgreSQL connection parameters
         # Connect directly to PostgreSQL (PgBouncer has DNS issues)
         self.pg_params = {
@@ -52,13 +447,12 @@ class DatabaseAnalytics:
 
     def _connect(self):
         """Establish database connections"""
-        try:
-            if psycopg2:
-                self.pg_conn = psycopg2.connect(**self.pg_params)
-                logger.info("✓ PostgreSQL connection established")
-            else:
-                logger.warning("psycopg2 not installed - PostgreSQL features disabled")
+        if psycopg2:
+            self._connect_postgres()
+        else:
+            logger.warning("psycopg2 not installed - PostgreSQL features disabled")
 
+        try:
             if redis:
                 self.redis_client = redis.Redis(**self.redis_params)
                 self.redis_client.ping()
@@ -69,188 +463,186 @@ class DatabaseAnalytics:
         except Exception as e:
             logger.error(f"Database connection error: {e}")
 
-    def _execute_query(self, query: str, params: tuple = None) -> List[Dict]:
-        """Execute PostgreSQL query and return results as list of dicts"""
-        if not self.pg_conn:
-            return []
+    def _connect_postgres(self) -> bool:
+        """Open the PostgreSQL pool, backing off exponentially (up to PG_RETRY_MAX_SECONDS) on failure"""
+        with self._pg_connect_lock:
+            if self.pg_pool:
+                return True
+            if time.monotonic() < self._pg_next_retry:
+                return False
+            try:
+                self.pg_pool = ThreadedConnectionPool(
+                    PG_POOL_MIN_CONN, PG_POOL_MAX_CONN,
+                    connection_factory=PreparingConnection, **self.pg_params
+                )
+                self._pg_failures = 0
+                logger.info("✓ PostgreSQL connection pool established")
+                return True
+            except Exception as e:
+                delay = min(PG_RETRY_MAX_SECONDS, 2 ** self._pg_failures)
+                self._pg_failures += 1
+                self._pg_next_retry = time.monotonic() + delay
+                logger.error(f"Database connection error: {e} (retrying in {delay}s)")
+                return False
+
+    def _execute_query(self, query: str, params: tuple = None, statement: str = None,
+                       stream: bool = False) -> List[Dict]:
+        """Execute PostgreSQL query and return results as list of dicts
+
+        Rows are read as plain tuples and zipped with the column names once
+        per result, rather than built by RealDictCursor's per-row machinery.
+        With a statement name the query is PREPAREd once per pooled connection
+        and EXECUTEd after that, so PostgreSQL skips re-parsing and re-planning.
+        With stream=True the rows come through a server-side cursor in batches
+        of STREAM_ITERSIZE instead of one buffered result (DECLARE can't wrap
+        EXECUTE, so streaming queries are not prepared).
+        """
+        if stream:
+            return self._run_query(query, params, None, _fetch_all_as_dicts, [], name='analytics_stream')
+        return self._run_query(query, params, statement, _fetch_all_as_dicts, [])
 
-        try:
-            # Reconnect if connection is closed
-            if self.pg_conn.closed:
-                self._connect()
+    def _execute_query_one(self, query: str, params: tuple = None, statement: str = None) -> Dict:
+        """Execute a single-row aggregate query and return it as a dict ({} if no row)
 
-            with self.pg_conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                return cursor.fetchall()
-        except Exception as e:
-            logger.error(f"Query execution error: {e}")
-            return []
+        Column names come from cursor.description, as in _execute_query.
+        """
+        return self._run_query(query, params, statement, _fetch_one_as_dict, {})
+
+    def _run_query(self, query: str, params: Optional[tuple], statement: Optional[str],
+                   fetch, default, **cursor_kwargs):
+        """Borrow a pooled connection, run query (PREPAREd if named) and return fetch(cursor)"""
+        if not self.pg_pool and not (psycopg2 and self._connect_postgres()):
+            return default
+
+        with self._pg_slots:
+            # A pooled connection can be dead (e.g. PostgreSQL restarted) - drop it and retry once
+            for attempt in range(2):
+                conn = None
+                try:
+                    conn = self.pg_pool.getconn()
+                    with conn.cursor(**cursor_kwargs) as cursor:
+                        if cursor.name:
+                            cursor.itersize = STREAM_ITERSIZE
+                        if statement is None:
+                            cursor.execute(query, params)
+                        else:
+                            if statement not in conn.prepared:
+                                self._prepare(cursor, statement, query)
+                                conn.prepared.add(statement)
+                            placeholders = ', '.join(['%s'] * len(params)) if params else ''
+                            cursor.execute(
+                                f"EXECUTE {statement} ({placeholders})" if params else f"EXECUTE {statement}",
+                                params
+                            )
+                        return fetch(cursor)
+                except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                    # Broken socket - discard it so the pool opens a fresh one next time
+                    if conn is not None:
+                        self.pg_pool.putconn(conn, close=True)
+                        conn = None
+                    logger.error(f"Query connection error: {e}")
+                except Exception as e:
+                    logger.error(f"Query execution error: {e}")
+                    return default
+                finally:
+                    # The pool rolls back anything left open before reuse
+                    if conn is not None:
+                        self.pg_pool.putconn(conn)
+        return default
+
+    def _cached(self, key: str, ttl: int, load):
+        """Return the cached value for key (in-process, then Redis), calling load() on a miss"""
+        now = time.monotonic()
+        with self._l1_lock:
+            entry = self._l1_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
 
+        if self.redis_client:
+            try:
+                cached = self.redis_client.get(key)
+                if cached is not None:
+                    result = json.loads(cached, object_hook=_decode_cached)
+                    self._l1_store(key, result)
+                    return result
+            except Exception as e:
+                logger.warning(f"Cache read error for {key}: {e}")
+
+        result = load()
+        # Empty results are also what a failed query returns - don't pin those
+        if result:
+            self._l1_store(key, result)
+            if self.redis_client:
+                try:
+                    self.redis_client.setex(key, ttl, json.dumps(result, default=_encode_cached))
+                except Exception as e:
+                    logger.warning(f"Cache write error for {key}: {e}")
+        return result
+
+    def _l1_store(self, key: str, value):
+        """Remember value in the in-process cache for L1_CACHE_SECONDS"""
+        now = time.monotonic()
+        with self._l1_lock:
+            if len(self._l1_cache) >= L1_CACHE_MAX_ENTRIES:
+                for stale in [k for k, (expires, _) in self._l1_cache.items() if expires <= now]:
+                    del self._l1_cache[stale]
+                if len(self._l1_cache) >= L1_CACHE_MAX_ENTRIES:
+                    # Still full - evict the oldest insertion
+                    del self._l1_cache[next(iter(self._l1_cache))]
+            self._l1_cache[key] = (now + L1_CACHE_SECONDS, value)
+
+    @staticmethod
+    def _prepare(cursor, statement: str, query: str):
+        """PREPARE query under statement name on the cursor's connection"""
+        counter = iter(range(1, query.count('%s') + 1))
+        body = PLACEHOLDER_PATTERN.sub(lambda _: f"${next(counter)}", query.strip().rstrip(';'))
+        cursor.execute(f"PREPARE {statement} AS {body}")
+        # Settle the PREPARE now rather than leave it to the pool's rollback
+        cursor.connection.commit()
+
+    @redis_cached('portfolio_summary', ttl=10)
     def get_portfolio_summary(self) -> Dict:
         """Get overall portfolio summary across all bots"""
-        query = """
-        SELECT
-            COUNT(DISTINCT bot_id) as total_bots,
-            SUM(current_equity) as total_equity,
-            SUM(initial_capital) as total_capital,
-            COUNT(*) FILTER (WHERE status = 'active') as active_bots,
-            COUNT(*) FILTER (WHERE status = 'paused') as paused_bots
-        FROM trading.bots;
-        """
+        query = SQL_PORTFOLIO_SUMMARY
 
-        result = self._execute_query(query)
-        if result:
-            return dict(result[0])
-        return {}
+        return self._execute_query_one(query, None, 'portfolio_summary')
 
+    @redis_cached('bot_summary', ttl=10)
     def get_bot_summary(self, bot_id: str = None) -> List[Dict]:
         """Get summary for specific bot or all bots"""
         if bot_id:
-            query = """
-            SELECT
-                bot_id,
-                bot_name,
-                bot_type,
-                status,
-                initial_capital,
-                current_equity,
-                ROUND((current_equity - initial_capital) / initial_capital * 100, 2) as return_pct,
-                last_heartbeat
-            FROM trading.bots
-            WHERE bot_id = %s;
-            """
+            query = SQL_BOT_SUMMARY_ONE
             params = (bot_id,)
+            statement = 'bot_summary_one'
         else:
-            query = """
-            SELECT
-                bot_id,
-                bot_name,
-                bot_type,
-                status,
-                initial_capital,
-                current_equity,
-                ROUND((current_equity - initial_capital) / initial_capital * 100, 2) as return_pct,
-                last_heartbeat
-            FROM trading.bots
-            ORDER BY bot_type, bot_id;
-            """
+            query = SQL_BOT_SUMMARY_ALL
             params = None
+            statement = 'bot_summary_all'
 
-        return self._execute_query(query, params)
+        return self._execute_query(query, params, statement)
 
+    @redis_cached('trading_summary', ttl=30)
     def get_trading_summary(self, bot_id: str = None, days: int = 7) -> Dict:
         """
         Get trading summary from completed_trades table (Bybit API synced data)
         Falls back to trades_pnl view if completed_trades is empty
         """
-        date_filter = datetime.now() - timedelta(days=days)
-
+        # One round-trip: completed-trade aggregates plus open and total fill counts
         if bot_id:
-            # First try the new completed_trades table
-            query = """
-            SELECT
-                bot_id,
-                COUNT(*) as total_trades,
-                COUNT(*) FILTER (WHERE net_pnl > 0) as winning_trades,
-                COUNT(*) FILTER (WHERE net_pnl <= 0) as losing_trades,
-                COUNT(*) as closed_trades,
-                ROUND(SUM(net_pnl), 2) as total_pnl,
-                ROUND(AVG(net_pnl), 2) as avg_pnl,
-                ROUND(MAX(net_pnl), 2) as max_win,
-                ROUND(MIN(net_pnl), 2) as max_loss,
-                ROUND(SUM(total_commission), 2) as total_fees
-            FROM trading.completed_trades
-            WHERE bot_id = %s AND exit_time >= %s
-            GROUP BY bot_id;
-            """
-            params = (bot_id, date_filter)
+            query = SQL_TRADING_SUMMARY_ONE
+            params = (bot_id, days)
+            statement = 'trading_summary_one'
         else:
-            query = """
-            SELECT
-                COUNT(*) as total_trades,
-                COUNT(*) FILTER (WHERE net_pnl > 0) as winning_trades,
-                COUNT(*) FILTER (WHERE net_pnl <= 0) as losing_trades,
-                COUNT(*) as closed_trades,
-                ROUND(SUM(net_pnl), 2) as total_pnl,
-                ROUND(AVG(net_pnl), 2) as avg_pnl,
-                ROUND(MAX(net_pnl), 2) as max_win,
-                ROUND(MIN(net_pnl), 2) as max_loss,
-                ROUND(SUM(total_commission), 2) as total_fees
-            FROM trading.completed_trades
-            WHERE exit_time >= %s;
-            """
-            params = (date_filter,)
-
-        # Also get count of active fills (not yet closed)
-        if bot_id:
-            fills_query = """
-            SELECT COUNT(*) FILTER (WHERE side = 'Buy') as open_trades
-            FROM trading.fills f
-            WHERE bot_id = %s AND exec_time >= %s
-                AND NOT EXISTS (
-                    SELECT 1 FROM trading.fills f2
-                    WHERE f2.bot_id = f.bot_id
-                        AND f2.symbol = f.symbol
-                        AND f2.side = 'Sell'
-                        AND f2.exec_time > f.exec_time
-                );
-            """
-            fills_params = (bot_id, date_filter)
-        else:
-            fills_query = """
-            SELECT COUNT(*) FILTER (WHERE side = 'Buy') as open_trades
-            FROM trading.fills f
-            WHERE exec_time >= %s
-                AND NOT EXISTS (
-                    SELECT 1 FROM trading.fills f2
-                    WHERE f2.bot_id = f.bot_id
-                        AND f2.symbol = f.symbol
-                        AND f2.side = 'Sell'
-                        AND f2.exec_time > f.exec_time
-                );
-            """
-            fills_params = (date_filter,)
-
-        result = self._execute_query(query, params)
-        fills_result = self._execute_query(fills_query, fills_params)
-
-        # Always count fills to show activity even if no completed trades
-        if bot_id:
-            total_fills_query = """
-            SELECT COUNT(*) as fill_count
-            FROM trading.fills
-            WHERE bot_id = %s AND exec_time >= %s;
-            """
-            total_fills_params = (bot_id, date_filter)
-        else:
-            total_fills_query = """
-            SELECT COUNT(*) as fill_count
-            FROM trading.fills
-            WHERE exec_time >= %s;
-            """
-            total_fills_params = (date_filter,)
-
-        fills_count_result = self._execute_query(total_fills_query, total_fills_params)
-        total_fills = fills_count_result[0].get('fill_count', 0) if fills_count_result else 0
-
-        if result and result[0].get('total_trades'):
-            summary = dict(result[0])
-            # Add open trades count
-            if fills_result:
-                summary['open_trades'] = fills_result[0].get('open_trades', 0) or 0
-            else:
-                summary['open_trades'] = 0
+            query = SQL_TRADING_SUMMARY_ALL
+            params = (days,)
+            statement = 'trading_summary_all'
 
-            # Add filled_trades (same as total_trades for completed)
-            summary['filled_trades'] = summary.get('total_trades', 0)
+        summary = self._execute_query_one(query, params, statement)
+        total_fills = summary.get('fill_count', 0)
 
-            # Calculate win rate
-            if summary.get('closed_trades', 0) > 0:
-                summary['win_rate'] = round(
-                    (summary.get('winning_trades', 0) / summary['closed_trades']) * 100, 2
-                )
-            else:
-                summary['win_rate'] = 0.0
+        if summary.get('total_trades'):
+            # win_rate and filled_trades come back display-ready from the query
+            del summary['fill_count']
             return summary
         else:
             # No completed trades, but show fills activity
@@ -269,170 +661,83 @@ class DatabaseAnalytics:
                 'win_rate': 0.0
             }
 
+    @redis_cached('active_positions', ttl=5)
     def get_active_positions(self, bot_id: str = None) -> List[Dict]:
         """Get all active positions from the positions table"""
         if bot_id:
-            query = """
-            SELECT
-                bot_id,
-                symbol,
-                side,
-                size,
-                avg_entry_price,
-                updated_at as opened_at
-            FROM trading.positions
-            WHERE bot_id = %s AND size > 0
-            ORDER BY updated_at DESC;
-            """
+            query = SQL_ACTIVE_POSITIONS_ONE
             params = (bot_id,)
         else:
-            query = """
-            SELECT
-                bot_id,
-                symbol,
-                side,
-                size,
-                avg_entry_price,
-                updated_at as opened_at
-            FROM trading.positions
-            WHERE size > 0
-            ORDER BY bot_id, updated_at DESC;
-            """
+            query = SQL_ACTIVE_POSITIONS_ALL
             params = None
 
-        return self._execute_query(query, params)
+        # Unbounded result set - stream it rather than buffer it in one fetch
+        return self._execute_query(query, params, stream=True)
 
     def get_recent_trades(self, bot_id: str = None, limit: int = 10) -> List[Dict]:
         """Get recent completed trades from completed_trades table"""
+        # The /trades presets repeat constantly - serve those from the cache
+        if limit in RECENT_TRADES_CACHED_LIMITS:
+            return self._recent_trades_cached(bot_id, limit)
+        return self._recent_trades(bot_id, limit)
+
+    def _recent_trades(self, bot_id: str = None, limit: int = 10) -> List[Dict]:
+        """Query the latest limit completed trades"""
         if bot_id:
-            query = """
-            SELECT
-                bot_id,
-                symbol,
-                entry_side as side,
-                entry_time,
-                exit_time,
-                entry_price,
-                exit_price,
-                entry_qty as quantity,
-                net_pnl as pnl_usd,
-                pnl_pct,
-                exit_reason,
-                'filled' as status
-            FROM trading.completed_trades
-            WHERE bot_id = %s
-            ORDER BY exit_time DESC
-            LIMIT %s;
-            """
+            query = SQL_RECENT_TRADES_ONE
             params = (bot_id, limit)
+            statement = 'recent_trades_one'
         else:
-            query = """
-            SELECT
-                bot_id,
-                symbol,
-                entry_side as side,
-                entry_time,
-                exit_time,
-                entry_price,
-                exit_price,
-                entry_qty as quantity,
-                net_pnl as pnl_usd,
-                pnl_pct,
-                exit_reason,
-                'filled' as status
-            FROM trading.completed_trades
-            ORDER BY exit_time DESC
-            LIMIT %s;
-            """
+            query = SQL_RECENT_TRADES_ALL
             params = (limit,)
+            statement = 'recent_trades_all'
+
+        return self._execute_query(query, params, statement)
 
-        return self._execute_query(query, params)
+    _recent_trades_cached = redis_cached('recent_trades', ttl=5)(_recent_trades)
 
+    @redis_cached('daily_performance', ttl=30)
     def get_daily_performance(self, bot_id: str = None, days: int = 7) -> List[Dict]:
         """Get daily performance from completed_trades table"""
-        date_filter = datetime.now() - timedelta(days=days)
-
         if bot_id:
-            query = """
-            SELECT
-                DATE(exit_time) as trade_date,
-                COUNT(*) as trades,
-                COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
-                COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
-                ROUND(SUM(net_pnl), 2) as daily_pnl,
-                ROUND(AVG(net_pnl), 2) as avg_pnl
-            FROM trading.completed_trades
-            WHERE bot_id = %s AND exit_time >= %s
-            GROUP BY DATE(exit_time)
-            ORDER BY trade_date DESC;
-            """
-            params = (bot_id, date_filter)
+            query = SQL_DAILY_PERFORMANCE_ONE
+            params = (bot_id, days)
+            statement = 'daily_performance_one'
         else:
-            query = """
-            SELECT
-                DATE(exit_time) as trade_date,
-                COUNT(*) as trades,
-                COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
-                COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
-                ROUND(SUM(net_pnl), 2) as daily_pnl,
-                ROUND(AVG(net_pnl), 2) as avg_pnl
-            FROM trading.completed_trades
-            WHERE exit_time >= %s
-            GROUP BY DATE(exit_time)
-            ORDER BY trade_date DESC;
-            """
-            params = (date_filter,)
-
-        return self._execute_query(query, params)
+            query = SQL_DAILY_PERFORMANCE_ALL
+            params = (days,)
+            statement = 'daily_performance_all'
+
+        return self._execute_query(query, params, statement)
 
+    @redis_cached('exit_reasons', ttl=30)
     def get_exit_reason_breakdown(self, bot_id: str = None, days: int = 7) -> List[Dict]:
         """Get breakdown of exit reasons from completed_trades table"""
-        date_filter = datetime.now() - timedelta(days=days)
-
         if bot_id:
-            query = """
-            SELECT
-                exit_reason,
-                COUNT(*) as count,
-                COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
-                COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
-                ROUND(SUM(net_pnl), 2) as total_pnl,
-                ROUND(AVG(net_pnl), 2) as avg_pnl,
-                ROUND(AVG(holding_duration_seconds) / 60, 2) as avg_holding_minutes
-            FROM trading.completed_trades
-            WHERE bot_id = %s AND exit_time >= %s
-            GROUP BY exit_reason
-            ORDER BY count DESC;
-            """
-            params = (bot_id, date_filter)
+            query = SQL_EXIT_REASONS_ONE
+            params = (bot_id, days)
+            statement = 'exit_reasons_one'
         else:
-            query = """
-            SELECT
-                exit_reason,
-                COUNT(*) as count,
-                COUNT(*) FILTER (WHERE net_pnl > 0) as wins,
-                COUNT(*) FILTER (WHERE net_pnl <= 0) as losses,
-                ROUND(SUM(net_pnl), 2) as total_pnl,
-                ROUND(AVG(net_pnl), 2) as avg_pnl,
-                ROUND(AVG(holding_duration_seconds) / 60, 2) as avg_holding_minutes
-            FROM trading.completed_trades
-            WHERE exit_time >= %s
-            GROUP BY exit_reason
-            ORDER BY count DESC;
-            """
-            params = (date_filter,)
-
-        return self._execute_query(query, params)
+            query = SQL_EXIT_REASONS_ALL
+            params = (days,)
+            statement = 'exit_reasons_all'
 
+        return self._execute_query(query, params, statement)
+
+    @redis_cached('redis_stats', ttl=30)
     def get_redis_stats(self) -> Dict:
         """Get Redis cache statistics"""
         if not self.redis_client:
             return {}
 
         try:
-            info = self.redis_client.info()
+            # INFO and DBSIZE in one round-trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.info()
+            pipe.dbsize()
+            info, total_keys = pipe.execute()
             return {
-                'total_keys': self.redis_client.dbsize(),
+                'total_keys': total_keys,
                 'used_memory': info.get('used_memory_human', 'N/A'),
                 'connected_clients': info.get('connected_clients', 0),
                 'uptime_days': info.get('uptime_in_days', 0),
@@ -445,45 +750,25 @@ class DatabaseAnalytics:
             logger.error(f"Redis stats error: {e}")
             return {}
 
+    @redis_cached('fills_count', ttl=60)
     def get_fills_count(self, bot_id: str = None, days: int = 7) -> Dict:
         """Get fill statistics (buy/sell activity)"""
-        date_filter = datetime.now() - timedelta(days=days)
-
         if bot_id:
-            query = """
-            SELECT
-                COUNT(*) as total_fills,
-                COUNT(*) FILTER (WHERE side = 'Buy') as buy_fills,
-                COUNT(*) FILTER (WHERE side = 'Sell') as sell_fills,
-                ROUND(SUM(commission), 2) as total_fees,
-                COUNT(DISTINCT symbol) as symbols_traded
-            FROM trading.fills
-            WHERE bot_id = %s AND exec_time >= %s;
-            """
-            params = (bot_id, date_filter)
+            query = SQL_FILLS_STATS_ONE
+            params = (bot_id, days)
+            statement = 'fills_stats_one'
         else:
-            query = """
-            SELECT
-                COUNT(*) as total_fills,
-                COUNT(*) FILTER (WHERE side = 'Buy') as buy_fills,
-                COUNT(*) FILTER (WHERE side = 'Sell') as sell_fills,
-                ROUND(SUM(commission), 2) as total_fees,
-                COUNT(DISTINCT symbol) as symbols_traded
-            FROM trading.fills
-            WHERE exec_time >= %s;
-            """
-            params = (date_filter,)
-
-        result = self._execute_query(query, params)
-        if result:
-            return dict(result[0])
-        return {}
+            query = SQL_FILLS_STATS_ALL
+            params = (days,)
+            statement = 'fills_stats_all'
+
+        return self._execute_query_one(query, params, statement)
 
     def close(self):
         """Close database connections"""
-        if self.pg_conn and not self.pg_conn.closed:
-            self.pg_conn.close()
-            logger.info("PostgreSQL connection closed")
+        if self.pg_pool and not self.pg_pool.closed:
+            self.pg_pool.closeall()
+            logger.info("PostgreSQL connection pool closed")
 
         if self.redis_client:
             self.redis_client.close()
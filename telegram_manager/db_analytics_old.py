@@ -346,11 +346,12 @@ class DatabaseAnalytics:
             total_trades
         FROM trading.risk_metrics
         WHERE date = CURRENT_DATE
-        """ + (f" AND bot_id = '{bot_id}'" if bot_id else "") + """
+        """ + (" AND bot_id = %s" if bot_id else "") + """
         ORDER BY bot_id;
         """
+        params = (bot_id,) if bot_id else None
 
-        return self._execute_query(query)
+        return self._execute_query(query, params)
 
     def get_redis_stats(self) -> Dict:
         """Get Redis cache statistics"""
@@ -7,65 +7,219 @@ import time
 import hmac
 import hashlib
 import asyncio
-from typing import Dict, List, Optional
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import datetime, timezone
 from urllib.parse import unquote
 import aiohttp
 import logging
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    # Optional: C JSON parser for the large paginated history responses
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from config import (
     BYBIT_API_KEY,
     BYBIT_API_SECRET,
     BYBIT_REST_URL,
-    RATE_LIMIT_DELAY,
-    MAX_EXECUTIONS_PER_REQUEST
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_BURST,
+    MAX_EXECUTIONS_PER_REQUEST,
+    FETCH_SUBWINDOW_HOURS,
+    FETCH_CONCURRENCY,
+    HTTP_POOL_SIZE,
+    REDIS_HOST,
+    REDIS_PORT,
+    REDIS_DB,
+    REDIS_PASSWORD,
+    BYBIT_RESPONSE_CACHE_SECONDS,
+    BYBIT_RESPONSE_CACHE_SETTLE_SECONDS,
+    RESPONSE_CACHE_TIMEOUT_SECONDS,
+    RESPONSE_CACHE_COOLDOWN_SECONDS
 )
 
 logger = logging.getLogger(__name__)
 
+# Bybit recv_window (ms), sent as a header and signed as part of every request
+RECV_WINDOW = "5000"
+RECV_WINDOW_BYTES = RECV_WINDOW.encode('ascii')
+
+# Read-only history endpoints whose pages are safe to replay from the response cache
+CACHEABLE_ENDPOINTS = frozenset({'/v5/position/closed-pnl', '/v5/execution/list'})
+
+# Request parameters whose values arrive URL-encoded from Bybit (pagination cursors)
+URL_ENCODED_PARAMS = frozenset({'cursor'})
+
+
+class TokenBucket:
+    """Async token bucket: refills at rate tokens/second, holds at most capacity"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, sleeping until one has refilled if the bucket is empty"""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self.updated is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            sleep_time = (1 - self.tokens) / self.rate
+            logger.debug("Rate limiting: sleeping for %.3fs", sleep_time)
+            # Waiters queue on the lock, so they are released one refill apart
+            await asyncio.sleep(sleep_time)
+            self.tokens = 0
+            self.updated = loop.time()
+
 
 class BybitSyncClient:
     """Client for fetching execution history from Bybit API"""
 
+    # Bybit limits per API key, so clients sharing a key share its bucket
+    _rate_buckets: Dict[str, TokenBucket] = {}
+
+    # One keep-alive HTTP session shared by every client in the process, so
+    # per-bot clients and pagination bursts reuse warm TLS connections
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _shared_session_lock = asyncio.Lock()
+
+    # Redis cache of history pages, shared the same way (None until first use)
+    _response_cache = None
+    # Monotonic time before which the cache is skipped after a Redis failure
+    _response_cache_disabled_until = 0.0
+
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
         self.api_key = api_key or BYBIT_API_KEY
         self.api_secret = api_secret or BYBIT_API_SECRET
+        # Signature inputs that never change per client, encoded once
+        self._secret_bytes = self.api_secret.encode('utf-8')
+        self._api_key_bytes = self.api_key.encode('utf-8')
+        self._base_headers = {
+            "X-BAPI-API-KEY": self.api_key,
+            "X-BAPI-RECV-WINDOW": RECV_WINDOW,
+            "Content-Type": "application/json"
+        }
         self.base_url = BYBIT_REST_URL
         self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = 0
+        self._rate_bucket = self._rate_buckets.setdefault(
+            self.api_key, TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        )
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = await self.get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The shared session outlives this client; shutdown() closes it
+        self.session = None
+
+    @classmethod
+    async def get_shared_session(cls) -> aiohttp.ClientSession:
+        """Return the process-wide HTTP session, creating it on first use"""
+        async with cls._shared_session_lock:
+            if cls._shared_session is None or cls._shared_session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=HTTP_POOL_SIZE,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+                cls._shared_session = aiohttp.ClientSession(connector=connector)
+            return cls._shared_session
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared HTTP session and response cache (call once at service exit)"""
+        if cls._shared_session is not None and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
+        if cls._response_cache is not None:
+            await cls._response_cache.aclose()
+        cls._response_cache = None
+
+    @classmethod
+    def _get_response_cache(cls):
+        """Return the process-wide Redis client for cached responses, or None when unavailable"""
+        if aioredis is None or time.monotonic() < cls._response_cache_disabled_until:
+            return None
+        if cls._response_cache is None:
+            cls._response_cache = aioredis.Redis(
+                host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB, password=REDIS_PASSWORD or None,
+                socket_connect_timeout=RESPONSE_CACHE_TIMEOUT_SECONDS,
+                socket_timeout=RESPONSE_CACHE_TIMEOUT_SECONDS
+            )
+        return cls._response_cache
+
+    @classmethod
+    def _disable_response_cache(cls, operation: str, error: Exception):
+        """Skip the cache for RESPONSE_CACHE_COOLDOWN_SECONDS so requests don't keep waiting on Redis"""
+        cls._response_cache_disabled_until = time.monotonic() + RESPONSE_CACHE_COOLDOWN_SECONDS
+        logger.warning(f"Response cache {operation} failed, disabling it for "
+                       f"{RESPONSE_CACHE_COOLDOWN_SECONDS}s: {str(error)}")
+
+    @staticmethod
+    def _is_settled(params: Optional[Dict]) -> bool:
+        """True when a history request's window ended long enough ago to be worth caching"""
+        end_time = params.get("endTime") if params else None
+        if end_time is None:
+            return False
+        return int(end_time) <= (time.time() - BYBIT_RESPONSE_CACHE_SETTLE_SECONDS) * 1000
+
+    def _response_cache_key(self, endpoint: str, query_string: str) -> str:
+        """Redis key for a response: endpoint plus a digest of account and canonical params"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._api_key_bytes)
+        digest.update(query_string.encode('utf-8'))
+        return f"bybit:{endpoint}:{digest.hexdigest()}"
+
+    async def _cache_get(self, key: str) -> Optional[bytes]:
+        """Cached response body for key, or None on a miss or cache error"""
+        cache = self._get_response_cache()
+        if cache is None:
+            return None
+        try:
+            return await cache.get(key)
+        except Exception as e:
+            self._disable_response_cache("read", e)
+            return None
+
+    async def _cache_set(self, key: str, body: bytes):
+        """Remember a successful response body for BYBIT_RESPONSE_CACHE_SECONDS"""
+        cache = self._get_response_cache()
+        if cache is None:
+            return
+        try:
+            await cache.setex(key, BYBIT_RESPONSE_CACHE_SECONDS, body)
+        except Exception as e:
+            self._disable_response_cache("write", e)
 
     def _generate_signature(self, timestamp: str, params: str) -> str:
         """Generate HMAC SHA256 signature for Bybit V5 API"""
-        recv_window = "5000"
-        param_str = f"{timestamp}{self.api_key}{recv_window}{params}"
-        logger.debug(f"Signature param_str: {param_str[:100]}...")
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            param_str.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        logger.debug(f"Generated signature: {signature[:20]}...")
-        return signature
+        # timestamp + api_key + recv_window + params, signed via OpenSSL's one-shot HMAC
+        message = b"".join((
+            timestamp.encode('ascii'), self._api_key_bytes, RECV_WINDOW_BYTES, params.encode('utf-8')
+        ))
+        return hmac.digest(self._secret_bytes, message, 'sha256').hex()
 
     async def _rate_limit(self):
-        """Implement rate limiting: max 10 requests/second"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-
-        if time_since_last_request < RATE_LIMIT_DELAY:
-            sleep_time = RATE_LIMIT_DELAY - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f}s")
-            await asyncio.sleep(sleep_time)
-
-        self.last_request_time = time.time()
+        """Implement rate limiting: max 10 requests/second per API key"""
+        await self._rate_bucket.acquire()
 
     async def _make_request(
         self,
@@ -77,45 +231,51 @@ class BybitSyncClient:
         if not self.session:
             raise RuntimeError("Client session not initialized. Use 'async with' context manager.")
 
-        await self._rate_limit()
-
-        timestamp = str(int(time.time() * 1000))
-        recv_window = "5000"
-
         # Build query string (URL-decode values for signature, especially cursor parameter)
         # Bybit returns cursor URL-encoded in JSON, but expects decoded version in signature
+        # Every other parameter we send is plain ASCII, so only the cursor is decoded
         query_string = ""
         if params:
-            sorted_params = sorted(params.items())
-            # URL-decode parameter values for signature string
-            decoded_params = [(k, unquote(str(v))) for k, v in sorted_params]
-            query_string = "&".join([f"{k}={v}" for k, v in decoded_params])
+            query_string = "&".join(
+                f"{k}={unquote(str(v)) if k in URL_ENCODED_PARAMS else v}"
+                for k, v in sorted(params.items())
+            )
+
+        # History pages are deterministic in (account, params) - replay a recent copy if we have one.
+        # Windows reaching up to "now" are skipped: their endTime never repeats and their data is still moving
+        cache_key = None
+        if method == "GET" and endpoint in CACHEABLE_ENDPOINTS and self._is_settled(params):
+            cache_key = self._response_cache_key(endpoint, query_string)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return json_loads(cached).get('result', {})
+
+        await self._rate_limit()
+
+        timestamp = str(int(time.time() * 1000))
 
         # Generate signature
         signature = self._generate_signature(timestamp, query_string)
 
-        # Build headers
-        headers = {
-            "X-BAPI-API-KEY": self.api_key,
-            "X-BAPI-SIGN": signature,
-            "X-BAPI-TIMESTAMP": timestamp,
-            "X-BAPI-RECV-WINDOW": recv_window,
-            "Content-Type": "application/json"
-        }
+        # Static headers plus the per-request signature and timestamp
+        headers = self._base_headers.copy()
+        headers["X-BAPI-SIGN"] = signature
+        headers["X-BAPI-TIMESTAMP"] = timestamp
 
-        url = f"{self.base_url}{endpoint}"
-        if query_string:
-            url += f"?{query_string}"
+        url = f"{self.base_url}{endpoint}?{query_string}" if query_string else f"{self.base_url}{endpoint}"
 
         try:
             async with self.session.request(method, url, headers=headers, skip_auto_headers=['Content-Type']) as response:
                 response.raise_for_status()
-                data = await response.json()
+                body = await response.read()
+                data = json_loads(body)
 
                 if data.get('retCode') != 0:
                     logger.error(f"Bybit API error: {data.get('retMsg')} (code: {data.get('retCode')})")
                     raise Exception(f"Bybit API error: {data.get('retMsg')}")
 
+                if cache_key:
+                    await self._cache_set(cache_key, body)
                 return data.get('result', {})
 
         except aiohttp.ClientError as e:
@@ -188,38 +348,13 @@ class BybitSyncClient:
         Returns:
             Complete list of closed PnL records in the range
         """
-        all_records = []
-        cursor = None
-
-        while True:
-            result = await self.get_closed_pnl(
-                category=category,
-                symbol=symbol,
-                start_time=start_time,
-                end_time=end_time,
-                limit=100,
-                cursor=cursor
-            )
-
-            records = result.get('list', [])
-            next_cursor = result.get('nextPageCursor')
-
-            all_records.extend(records)
-
-            logger.info(f"Fetched {len(records)} closed PnL records (total: {len(all_records)})")
-
-            # Check if there are more pages
-            if not next_cursor or not records:
-                break
-
-            cursor = next_cursor
-            await asyncio.sleep(0.1)  # Small delay between paginated requests
-
-        logger.info(f"Completed fetching {len(all_records)} total closed PnL records for range "
-                   f"{datetime.fromtimestamp(start_time/1000, tz=timezone.utc)} to "
-                   f"{datetime.fromtimestamp(end_time/1000, tz=timezone.utc)}")
+        params = {"category": category, "limit": 100}
+        if symbol:
+            params["symbol"] = symbol
 
-        return all_records
+        return await self._fetch_range(
+            "/v5/position/closed-pnl", params, start_time, end_time, "closed PnL records"
+        )
 
     async def get_all_executions_in_range(
         self,
@@ -240,45 +375,136 @@ class BybitSyncClient:
         Returns:
             Complete list of executions in the range
         """
-        all_executions = []
+        params = {"category": category, "limit": MAX_EXECUTIONS_PER_REQUEST}
+        if symbol:
+            params["symbol"] = symbol
+
+        return await self._fetch_range(
+            "/v5/execution/list", params, start_time, end_time, "executions"
+        )
+
+    async def iter_closed_pnl_in_range(
+        self,
+        start_time: int,
+        end_time: int,
+        category: str = "linear",
+        symbol: Optional[str] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Yield closed PnL records in a time range, one time window at a time
+
+        Same records as get_all_closed_pnl_in_range, but only the windows
+        currently being fetched are held in memory.
+
+        Args:
+            start_time: Start timestamp in milliseconds
+            end_time: End timestamp in milliseconds
+            category: Product type
+            symbol: Trading symbol (optional)
+
+        Yields:
+            Closed PnL records of each window, in time-window order
+        """
+        params = {"category": category, "limit": 100}
+        if symbol:
+            params["symbol"] = symbol
+
+        async for records in self._iter_range(
+            "/v5/position/closed-pnl", params, start_time, end_time, "closed PnL records"
+        ):
+            yield records
+
+    async def _fetch_range(
+        self,
+        endpoint: str,
+        params: Dict,
+        start_time: int,
+        end_time: int,
+        label: str
+    ) -> List[Dict]:
+        """Fetch every page of endpoint between start_time and end_time"""
+        all_records = [
+            record
+            async for records in self._iter_range(endpoint, params, start_time, end_time, label)
+            for record in records
+        ]
+
+        logger.info(f"Completed fetching {len(all_records)} total {label} for range "
+                   f"{datetime.fromtimestamp(start_time/1000, tz=timezone.utc)} to "
+                   f"{datetime.fromtimestamp(end_time/1000, tz=timezone.utc)}")
+
+        return all_records
+
+    async def _iter_range(
+        self,
+        endpoint: str,
+        params: Dict,
+        start_time: int,
+        end_time: int,
+        label: str
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Yield the records of endpoint between start_time and end_time per window
+
+        The range is cut into FETCH_SUBWINDOW_HOURS windows whose cursor loops
+        run concurrently (at most FETCH_CONCURRENCY at once), so page round-trips
+        overlap instead of queueing; _rate_limit still spaces the requests.
+        Windows don't overlap and are yielded in time order; a new window is
+        only started once an earlier one has been handed to the caller.
+        """
+        window_ms = FETCH_SUBWINDOW_HOURS * 3600 * 1000
+        starts = list(range(start_time, max(end_time, start_time + 1), window_ms))
+        ends = [next_start - 1 for next_start in starts[1:]] + [end_time]
+        windows = iter(zip(starts, ends))
+        pending = deque()
+
+        def schedule():
+            while len(pending) < FETCH_CONCURRENCY:
+                window = next(windows, None)
+                if window is None:
+                    return
+                window_params = {**params, "startTime": str(window[0]), "endTime": str(window[1])}
+                pending.append(asyncio.create_task(self._fetch_pages(endpoint, window_params, label)))
+
+        try:
+            schedule()
+            while pending:
+                records = await pending.popleft()
+                schedule()
+                yield records
+        finally:
+            # Caller stopped early or a window failed: don't leave fetches running
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_pages(self, endpoint: str, params: Dict, label: str) -> List[Dict]:
+        """Follow nextPageCursor from params until the last page"""
+        all_records = []
         cursor = None
 
         while True:
-            params = {
-                "category": category,
-                "limit": MAX_EXECUTIONS_PER_REQUEST,
-                "startTime": str(start_time),
-                "endTime": str(end_time)
-            }
-
-            if symbol:
-                params["symbol"] = symbol
             if cursor:
                 params["cursor"] = cursor
                 logger.debug(f"Using cursor for pagination: {cursor}")
 
-            result = await self._make_request("GET", "/v5/execution/list", params)
-            executions = result.get('list', [])
+            result = await self._make_request("GET", endpoint, params)
+            records = result.get('list', [])
             next_cursor = result.get('nextPageCursor')
             if next_cursor:
                 logger.debug(f"Received nextPageCursor: {next_cursor}")
 
-            all_executions.extend(executions)
+            all_records.extend(records)
 
-            logger.info(f"Fetched {len(executions)} executions (total: {len(all_executions)})")
+            logger.info(f"Fetched {len(records)} {label} (total: {len(all_records)})")
 
             # Check if there are more pages
-            if not next_cursor or not executions:
+            if not next_cursor or not records:
                 break
 
             cursor = next_cursor
             await asyncio.sleep(0.1)  # Small delay between paginated requests
 
-        logger.info(f"Completed fetching {len(all_executions)} total executions for range "
-                   f"{datetime.fromtimestamp(start_time/1000, tz=timezone.utc)} to "
-                   f"{datetime.fromtimestamp(end_time/1000, tz=timezone.utc)}")
-
-        return all_executions
+        return all_records
 
     async def test_connection(self) -> bool:
         """Test API connection and credentials"""
@@ -3,29 +3,39 @@ Mapper to convert Bybit closed PnL records to completed_trades schema
 """
 
 import logging
-from typing import Dict, Optional
-from datetime import datetime, timezone, timedelta
+from typing import Dict, Iterable, Iterator, Optional
+from datetime import datetime, timezone
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+# Closed PnL side -> (entry_side, exit_side, default entry_reason, exit_reason)
+# "Buy" is a long (bought to enter, sold to exit), "Sell" a short
+SIDE_LEGS = {
+    'Buy': ('Buy', 'Sell', 'long_entry', 'long_exit'),
+    'Sell': ('Sell', 'Buy', 'short_entry', 'short_exit'),
+}
 
-class ClosedPnLMapper:
-    """Maps Bybit closed PnL records to completed_trades format"""
 
-    @staticmethod
-    def parse_order_link_id(order_link_id: Optional[str]) -> tuple[Optional[str], Optional[str]]:
-        """
-        Parse orderLinkId to extract bot_id and reason
-        Format: bot_id:reason:timestamp
-        """
-        if not order_link_id:
-            return None, None
+def parse_order_link_id(order_link_id: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    Parse orderLinkId to extract bot_id and reason
+    Format: bot_id:reason:timestamp
+    """
+    if not order_link_id:
+        return None, None
 
-        parts = order_link_id.split(':')
-        if len(parts) >= 2:
-            return parts[0], parts[1]  # bot_id, reason
+    # partition() avoids building a list of every field when only two are needed
+    bot_id, sep, rest = order_link_id.partition(':')
+    if not sep:
         return None, None
+    return bot_id, rest.partition(':')[0]
+
+
+class ClosedPnLMapper:
+    """Maps Bybit closed PnL records to completed_trades format"""
+
+    parse_order_link_id = staticmethod(parse_order_link_id)
 
     @staticmethod
     def map_closed_pnl_to_trade(record: Dict, bot_id: str) -> Optional[Dict]:
@@ -53,27 +63,26 @@ class ClosedPnLMapper:
             side = record.get('side')  # Buy or Sell
             qty = float(record.get('closedSize', 0))
 
-            # Parse timestamps (milliseconds to datetime)
+            # Parse timestamps (milliseconds since epoch)
             created_time_ms = int(record.get('createdTime', 0))
             updated_time_ms = int(record.get('updatedTime', 0))
 
+            # If times are equal, add 1 second to exit time to satisfy database constraint
+            if updated_time_ms <= created_time_ms:
+                updated_time_ms = created_time_ms + 1000
+
             entry_time = datetime.fromtimestamp(created_time_ms / 1000, tz=timezone.utc)
             exit_time = datetime.fromtimestamp(updated_time_ms / 1000, tz=timezone.utc)
 
-            # If times are equal, add 1 second to exit time to satisfy database constraint
-            if exit_time <= entry_time:
-                exit_time = entry_time + timedelta(seconds=1)
-                updated_time_ms = int(exit_time.timestamp() * 1000)
-
             # Extract prices and PnL
             avg_entry_price = float(record.get('avgEntryPrice', 0))
             avg_exit_price = float(record.get('avgExitPrice', 0))
             closed_pnl = float(record.get('closedPnl', 0))
 
             # Extract fees
-            open_fee = float(record.get('openFee', 0))
-            close_fee = float(record.get('closeFee', 0))
-            total_commission = abs(open_fee) + abs(close_fee)
+            open_fee = abs(float(record.get('openFee', 0)))
+            close_fee = abs(float(record.get('closeFee', 0)))
+            total_commission = open_fee + close_fee
 
             # Calculate net PnL (closed_pnl from Bybit already includes fees)
             gross_pnl = closed_pnl + total_commission  # Reconstruct gross PnL
@@ -84,26 +93,16 @@ class ClosedPnLMapper:
             pnl_pct = (closed_pnl / abs(entry_value) * 100) if entry_value != 0 else 0
 
             # Calculate holding duration
-            holding_duration_seconds = int((updated_time_ms - created_time_ms) / 1000)
+            holding_duration_seconds = (updated_time_ms - created_time_ms) // 1000
 
             # Try to extract reason from orderLinkId if available
             # Otherwise use default reason
             order_link_id = record.get('orderLinkId', '')
-            _, reason = ClosedPnLMapper.parse_order_link_id(order_link_id) if order_link_id else (None, None)
-
-            # Determine entry and exit sides
-            # If side is "Buy", it means we bought to enter and sold to exit (long position)
-            # If side is "Sell", it means we sold to enter and bought to exit (short position)
-            if side == "Buy":
-                entry_side = "Buy"
-                exit_side = "Sell"
-                entry_reason = reason or "long_entry"
-                exit_reason = "long_exit"
-            else:  # Sell
-                entry_side = "Sell"
-                exit_side = "Buy"
-                entry_reason = reason or "short_entry"
-                exit_reason = "short_exit"
+            _, reason = parse_order_link_id(order_link_id)
+
+            # Determine entry and exit sides (anything but "Buy" is treated as a short)
+            entry_side, exit_side, default_reason, exit_reason = SIDE_LEGS.get(side, SIDE_LEGS['Sell'])
+            entry_reason = reason or default_reason
 
             # Generate trade_id
             trade_id = f"{bot_id}_{symbol}_{created_time_ms}"
@@ -120,7 +119,7 @@ class ClosedPnLMapper:
                 'entry_qty': qty,
                 'entry_time': entry_time,
                 'entry_reason': entry_reason,
-                'entry_commission': abs(open_fee),
+                'entry_commission': open_fee,
                 'exit_order_id': order_id,  # Same order for now, could be different
                 'exit_client_order_id': order_link_id,
                 'exit_side': exit_side,
@@ -128,7 +127,7 @@ class ClosedPnLMapper:
                 'exit_qty': qty,
                 'exit_time': exit_time,
                 'exit_reason': exit_reason,
-                'exit_commission': abs(close_fee),
+                'exit_commission': close_fee,
                 'gross_pnl': gross_pnl,
                 'net_pnl': net_pnl,
                 'pnl_pct': pnl_pct,
@@ -146,9 +145,14 @@ class ClosedPnLMapper:
     @staticmethod
     def map_all(records: list[Dict], bot_id: str) -> list[Dict]:
         """Map all closed PnL records for a specific bot"""
-        trades = []
+        map_record = ClosedPnLMapper.map_closed_pnl_to_trade
+        return [trade for trade in (map_record(record, bot_id) for record in records) if trade]
+
+    @staticmethod
+    def map_iter(records: Iterable[Dict], bot_id: str) -> Iterator[Dict]:
+        """Lazily map closed PnL records for a specific bot, skipping invalid ones"""
+        map_record = ClosedPnLMapper.map_closed_pnl_to_trade
         for record in records:
-            trade = ClosedPnLMapper.map_closed_pnl_to_trade(record, bot_id)
+            trade = map_record(record, bot_id)
             if trade:
-                trades.append(trade)
-        return trades
+                yield trade
@@ -16,6 +16,8 @@ POSTGRES_PORT = int(os.getenv('POSTGRES_PORT', '6432'))
 POSTGRES_DB = os.getenv('POSTGRES_DB', 'trading_db')
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'trading_user')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'trading_password')
+DB_POOL_MIN_CONN = 2  # Connections kept open in the SyncDatabase pool
+DB_POOL_MAX_CONN = 8  # Upper bound, enough for every bot syncing at once
 
 # Bybit API Configuration
 BYBIT_API_KEY = os.getenv('BYBIT_API_KEY', '')
@@ -49,7 +51,9 @@ else:
 
 # Rate Limiting Configuration
 BYBIT_RATE_LIMIT_PER_SECOND = 10  # Bybit allows 10 requests/second for private endpoints
-RATE_LIMIT_DELAY = 0.12  # 120ms between requests (safer than 100ms for 10 req/sec)
+# Token bucket: bursts of RATE_LIMIT_BURST, refilled so no 1s window exceeds the Bybit limit
+RATE_LIMIT_BURST = 2
+RATE_LIMIT_PER_SECOND = BYBIT_RATE_LIMIT_PER_SECOND - RATE_LIMIT_BURST
 
 # Sync Configuration
 BACKFILL_MONTHS = 3  # Initial backfill period
@@ -59,6 +63,10 @@ SYNC_INTERVAL_SECONDS = 3600  # 1 hour
 # Batch Configuration
 BACKFILL_BATCH_DAYS = 1  # Backfill in 1-day chunks
 MAX_EXECUTIONS_PER_REQUEST = 100  # Bybit API limit
+FETCH_SUBWINDOW_HOURS = 6  # Ranges are paged in windows this long, concurrently
+FETCH_CONCURRENCY = 4  # Max windows paging at once (requests still rate limited)
+HTTP_POOL_SIZE = 20  # Keep-alive connections in the shared Bybit HTTP session
+SYNC_FLUSH_ROWS = 1000  # Mapped trades buffered per bulk insert while streaming a sync
 
 # Registered Bots
 REGISTERED_BOTS = [
@@ -80,3 +88,13 @@ TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
 REDIS_HOST = os.getenv('REDIS_HOST', 'redis')
 REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
 REDIS_DB = int(os.getenv('REDIS_SYNC_DB', '1'))  # Use separate DB from main app
+REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
+
+# Bybit history pages are cached this long (recent closed trades can still be amended)
+BYBIT_RESPONSE_CACHE_SECONDS = 300
+# Only windows that ended at least this long ago are cached; ranges ending at "now"
+# (hourly syncs) would never be requested with the same endTime again anyway
+BYBIT_RESPONSE_CACHE_SETTLE_SECONDS = 300
+# The cache sits in front of every history request, so give up on Redis quickly
+RESPONSE_CACHE_TIMEOUT_SECONDS = 0.5
+RESPONSE_CACHE_COOLDOWN_SECONDS = 300  # Cache stays off this long after a Redis failure
@@ -3,10 +3,11 @@ Database operations for Trade Sync Service
 """
 
 import logging
+import threading
 from typing import Dict, List, Optional
-from datetime import datetime, timezone
-import psycopg2
+from datetime import datetime
 from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
 
 from config import (
@@ -14,14 +15,52 @@ from config import (
     POSTGRES_PORT,
     POSTGRES_DB,
     POSTGRES_USER,
-    POSTGRES_PASSWORD
+    POSTGRES_PASSWORD,
+    DB_POOL_MIN_CONN,
+    DB_POOL_MAX_CONN
 )
 
 logger = logging.getLogger(__name__)
 
+BULK_INSERT_PAGE_SIZE = 500  # Rows per multi-row INSERT statement
+
+BULK_INSERT_COMPLETED_TRADES = """
+    INSERT INTO trading.completed_trades (
+        trade_id, bot_id, symbol,
+        entry_order_id, entry_client_order_id, entry_side, entry_price, entry_qty,
+        entry_time, entry_reason, entry_commission,
+        exit_order_id, exit_client_order_id, exit_side, exit_price, exit_qty,
+        exit_time, exit_reason, exit_commission,
+        gross_pnl, net_pnl, pnl_pct, total_commission, holding_duration_seconds,
+        source, synced_at
+    ) VALUES %s
+    ON CONFLICT (trade_id) DO UPDATE SET
+        synced_at = EXCLUDED.synced_at,
+        source = CASE
+            WHEN trading.completed_trades.source = 'websocket' THEN 'websocket'
+            ELSE EXCLUDED.source
+        END
+    RETURNING trade_id, (xmax = 0) AS inserted
+"""
+
+COMPLETED_TRADE_VALUES = """(
+    %(trade_id)s, %(bot_id)s, %(symbol)s,
+    %(entry_order_id)s, %(entry_client_order_id)s, %(entry_side)s, %(entry_price)s, %(entry_qty)s,
+    %(entry_time)s, %(entry_reason)s, %(entry_commission)s,
+    %(exit_order_id)s, %(exit_client_order_id)s, %(exit_side)s, %(exit_price)s, %(exit_qty)s,
+    %(exit_time)s, %(exit_reason)s, %(exit_commission)s,
+    %(gross_pnl)s, %(net_pnl)s, %(pnl_pct)s, %(total_commission)s, %(holding_duration_seconds)s,
+    %(source)s, NOW()
+)"""
+
 
 class SyncDatabase:
-    """Database manager for trade sync operations"""
+    """
+    Database manager for trade sync operations
+
+    Connections come from a thread-safe pool, so per-bot syncs can run
+    their queries concurrently from worker threads.
+    """
 
     def __init__(self):
         self.conn_params = {
@@ -31,40 +70,48 @@ class SyncDatabase:
             'user': POSTGRES_USER,
             'password': POSTGRES_PASSWORD
         }
-        self.conn = None
+        self.pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
 
     def connect(self):
-        """Establish database connection"""
-        try:
-            self.conn = psycopg2.connect(**self.conn_params)
-            self.conn.autocommit = False
-            logger.info("Database connection established")
-        except Exception as e:
-            logger.error(f"Failed to connect to database: {str(e)}")
-            raise
+        """Create the connection pool"""
+        with self._pool_lock:
+            if self.pool:
+                return
+            try:
+                self.pool = ThreadedConnectionPool(DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, **self.conn_params)
+                logger.info("Database connection pool established")
+            except Exception as e:
+                logger.error(f"Failed to connect to database: {str(e)}")
+                raise
 
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
-            logger.info("Database connection closed")
+        """Close every pooled connection"""
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
+            logger.info("Database connection pool closed")
 
     @contextmanager
     def get_cursor(self):
-        """Context manager for database cursor"""
-        if not self.conn:
+        """Context manager for a cursor on a pooled connection, committed on success"""
+        if not self.pool:
             self.connect()
 
-        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        conn = self.pool.getconn()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
         try:
             yield cursor
-            self.conn.commit()
+            conn.commit()
         except Exception as e:
-            self.conn.rollback()
+            if not conn.closed:
+                conn.rollback()
             logger.error(f"Database operation failed: {str(e)}")
             raise
         finally:
             cursor.close()
+            # Drop connections the server closed instead of handing them out again
+            self.pool.putconn(conn, close=bool(conn.closed))
 
     def insert_completed_trade(self, trade: Dict) -> bool:
         """
@@ -73,45 +120,16 @@ class SyncDatabase:
         Returns:
             True if inserted, False if duplicate
         """
-        query = """
-            INSERT INTO trading.completed_trades (
-                trade_id, bot_id, symbol,
-                entry_order_id, entry_client_order_id, entry_side, entry_price, entry_qty,
-                entry_time, entry_reason, entry_commission,
-                exit_order_id, exit_client_order_id, exit_side, exit_price, exit_qty,
-                exit_time, exit_reason, exit_commission,
-                gross_pnl, net_pnl, pnl_pct, total_commission, holding_duration_seconds,
-                source, synced_at
-            ) VALUES (
-                %(trade_id)s, %(bot_id)s, %(symbol)s,
-                %(entry_order_id)s, %(entry_client_order_id)s, %(entry_side)s, %(entry_price)s, %(entry_qty)s,
-                %(entry_time)s, %(entry_reason)s, %(entry_commission)s,
-                %(exit_order_id)s, %(exit_client_order_id)s, %(exit_side)s, %(exit_price)s, %(exit_qty)s,
-                %(exit_time)s, %(exit_reason)s, %(exit_commission)s,
-                %(gross_pnl)s, %(net_pnl)s, %(pnl_pct)s, %(total_commission)s, %(holding_duration_seconds)s,
-                %(source)s, NOW()
-            )
-            ON CONFLICT (trade_id) DO UPDATE SET
-                synced_at = EXCLUDED.synced_at,
-                source = CASE
-                    WHEN trading.completed_trades.source = 'websocket' THEN 'websocket'
-                    ELSE EXCLUDED.source
-                END
-            RETURNING (xmax = 0) AS inserted
-        """
-
         try:
-            with self.get_cursor() as cursor:
-                cursor.execute(query, trade)
-                result = cursor.fetchone()
-                was_inserted = result['inserted'] if result else False
+            results = self._upsert_completed_trades([trade])
+            was_inserted = results[0]['inserted'] if results else False
 
-                if was_inserted:
-                    logger.info(f"Inserted new trade: {trade['trade_id']}")
-                else:
-                    logger.info(f"Trade already exists (duplicate): {trade['trade_id']}")
+            if was_inserted:
+                logger.info(f"Inserted new trade: {trade['trade_id']}")
+            else:
+                logger.info(f"Trade already exists (duplicate): {trade['trade_id']}")
 
-                return was_inserted
+            return was_inserted
         except Exception as e:
             logger.error(f"Failed to insert trade {trade.get('trade_id')}: {str(e)}")
             raise
@@ -120,12 +138,45 @@ class SyncDatabase:
         """
         Bulk insert completed trades with duplicate detection
 
+        Sends the batch as multi-row INSERTs in a single transaction rather
+        than one round trip and commit per trade.
+
         Returns:
             Tuple of (inserted_count, skipped_count)
         """
         if not trades:
             return 0, 0
 
+        # One statement cannot upsert the same trade_id twice, so keep the last copy
+        unique_trades = list({trade['trade_id']: trade for trade in trades}.values())
+
+        try:
+            results = self._upsert_completed_trades(unique_trades)
+        except Exception as e:
+            # Fall back to row-at-a-time so one bad trade doesn't drop the whole batch
+            logger.error(f"Bulk insert failed, retrying row by row: {str(e)}")
+            return self._insert_completed_trades_individually(unique_trades)
+
+        inserted_count = sum(1 for row in results if row['inserted'])
+        skipped_count = len(trades) - inserted_count
+
+        logger.info(f"Bulk insert complete: {inserted_count} inserted, {skipped_count} duplicates skipped")
+        return inserted_count, skipped_count
+
+    def _upsert_completed_trades(self, trades: List[Dict]) -> List[Dict]:
+        """Upsert trades with paged multi-row INSERTs in one transaction, one result row each"""
+        with self.get_cursor() as cursor:
+            return execute_values(
+                cursor,
+                BULK_INSERT_COMPLETED_TRADES,
+                trades,
+                template=COMPLETED_TRADE_VALUES,
+                page_size=BULK_INSERT_PAGE_SIZE,
+                fetch=True
+            )
+
+    def _insert_completed_trades_individually(self, trades: List[Dict]) -> tuple[int, int]:
+        """Insert trades one statement at a time, counting failures as skipped"""
         inserted_count = 0
         skipped_count = 0
 
@@ -11,6 +11,7 @@ import signal
 from pathlib import Path
 
 from sync_service import TradeSyncService
+from bybit_client import BybitSyncClient
 from config import LOG_LEVEL, LOG_FILE
 
 # Setup logging
@@ -49,6 +50,14 @@ def setup_logging(log_level: str, log_file: str = None):
 logger = logging.getLogger(__name__)
 
 
+async def run_and_close(coro):
+    """Run a service coroutine, then close the shared Bybit HTTP session"""
+    try:
+        return await coro
+    finally:
+        await BybitSyncClient.shutdown()
+
+
 class ServiceRunner:
     """Runner for the trade sync service"""
 
@@ -260,16 +269,16 @@ Examples:
     # Execute command
     try:
         if args.command == 'backfill':
-            success = asyncio.run(runner.run_backfill(args.months, args.bot))
+            success = asyncio.run(run_and_close(runner.run_backfill(args.months, args.bot)))
         elif args.command == 'sync':
-            success = asyncio.run(runner.run_hourly_sync(args.bot))
+            success = asyncio.run(run_and_close(runner.run_hourly_sync(args.bot)))
         elif args.command == 'run':
-            success = asyncio.run(runner.run_continuous())
+            success = asyncio.run(run_and_close(runner.run_continuous()))
         elif args.command == 'stats':
-            success = asyncio.run(runner.show_stats(args.bot))
+            success = asyncio.run(run_and_close(runner.show_stats(args.bot)))
         elif args.command == 'test':
             service = TradeSyncService()
-            success = asyncio.run(service.test_connection())
+            success = asyncio.run(run_and_close(service.test_connection()))
         else:
             parser.print_help()
             success = False
@@ -4,6 +4,8 @@ One-time migration: Convert existing fills to completed_trades
 Matches buy/sell pairs from trading.fills table
 """
 
+import csv
+import io
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from datetime import timezone
@@ -49,33 +51,50 @@ def fetch_fills_from_db(bot_id):
     return [dict(fill) for fill in fills]
 
 
-def insert_completed_trade(trade, conn):
-    """Insert a completed trade into database"""
-    cursor = conn.cursor()
+COMPLETED_TRADE_COLUMNS = (
+    'trade_id', 'bot_id', 'symbol',
+    'entry_order_id', 'entry_client_order_id', 'entry_side', 'entry_price', 'entry_qty',
+    'entry_time', 'entry_reason', 'entry_commission',
+    'exit_order_id', 'exit_client_order_id', 'exit_side', 'exit_price', 'exit_qty',
+    'exit_time', 'exit_reason', 'exit_commission',
+    'gross_pnl', 'net_pnl', 'pnl_pct', 'total_commission', 'holding_duration_seconds',
+    'source'
+)
 
-    query = """
-        INSERT INTO trading.completed_trades (
-            trade_id, bot_id, symbol,
-            entry_order_id, entry_client_order_id, entry_side, entry_price, entry_qty,
-            entry_time, entry_reason, entry_commission,
-            exit_order_id, exit_client_order_id, exit_side, exit_price, exit_qty,
-            exit_time, exit_reason, exit_commission,
-            gross_pnl, net_pnl, pnl_pct, total_commission, holding_duration_seconds,
-            source, synced_at
-        ) VALUES (
-            %(trade_id)s, %(bot_id)s, %(symbol)s,
-            %(entry_order_id)s, %(entry_client_order_id)s, %(entry_side)s, %(entry_price)s, %(entry_qty)s,
-            %(entry_time)s, %(entry_reason)s, %(entry_commission)s,
-            %(exit_order_id)s, %(exit_client_order_id)s, %(exit_side)s, %(exit_price)s, %(exit_qty)s,
-            %(exit_time)s, %(exit_reason)s, %(exit_commission)s,
-            %(gross_pnl)s, %(net_pnl)s, %(pnl_pct)s, %(total_commission)s, %(holding_duration_seconds)s,
-            %(source)s, NOW()
-        )
-        ON CONFLICT (trade_id) DO NOTHING
+COPY_NULL = r'\N'
+
+
+def insert_completed_trades(trades, conn):
     """
+    Insert completed trades via COPY into a staging table, returning how many were new
+
+    COPY can't skip duplicates, so rows land in a temp table first and are
+    moved across with INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+    """
+    columns = ', '.join(COMPLETED_TRADE_COLUMNS)
+
+    # None goes out as the \N null marker so empty strings stay empty strings
+    buf = io.StringIO()
+    csv.writer(buf).writerows(
+        [COPY_NULL if trade[column] is None else trade[column] for column in COMPLETED_TRADE_COLUMNS]
+        for trade in trades
+    )
+    buf.seek(0)
 
-    cursor.execute(query, trade)
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        CREATE TEMP TABLE completed_trades_staging ON COMMIT DROP AS
+        SELECT {columns} FROM trading.completed_trades WITH NO DATA
+    """)
+    cursor.copy_expert(f"COPY completed_trades_staging ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')", buf)
+    cursor.execute(f"""
+        INSERT INTO trading.completed_trades ({columns}, synced_at)
+        SELECT {columns}, NOW() FROM completed_trades_staging
+        ON CONFLICT (trade_id) DO NOTHING
+    """)
+    inserted = cursor.rowcount
     cursor.close()
+    return inserted
 
 
 def migrate_bot_fills(bot_id):
@@ -108,19 +127,20 @@ def migrate_bot_fills(bot_id):
         password=POSTGRES_PASSWORD
     )
 
-    inserted = 0
+    # Update source to 'manual' (fills_migration not in check constraint)
     for trade in matched_trades:
-        try:
-            # Update source to 'manual' (fills_migration not in check constraint)
-            trade['source'] = 'manual'
-            insert_completed_trade(trade, conn)
-            inserted += 1
-        except Exception as e:
-            logger.error(f"  Failed to insert trade {trade.get('trade_id')}: {str(e)}")
-            conn.rollback()  # Rollback failed transaction
-
-    conn.commit()
-    conn.close()
+        trade['source'] = 'manual'
+
+    # All of the bot's trades go in as one transaction
+    try:
+        inserted = insert_completed_trades(matched_trades, conn)
+        conn.commit()
+    except Exception as e:
+        logger.error(f"  Failed to insert trades for {bot_id}: {str(e)}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
     logger.info(f"  Inserted {inserted} completed trades for {bot_id}")
     return inserted
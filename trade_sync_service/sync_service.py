@@ -4,7 +4,7 @@ Trade Sync Service - Main service for syncing completed trades from Bybit
 
 import asyncio
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, Dict
 from datetime import datetime, timedelta, timezone
 
 from bybit_client import BybitSyncClient
@@ -17,6 +17,7 @@ from config import (
     BACKFILL_BATCH_DAYS,
     HOURLY_SYNC_OVERLAP_HOURS,
     SYNC_INTERVAL_SECONDS,
+    SYNC_FLUSH_ROWS,
     BOT_API_KEYS
 )
 
@@ -57,7 +58,10 @@ class TradeSyncService:
         logger.info(f"Starting {sync_type} sync for {bot_id} using closed PnL: {start_time} to {end_time}")
 
         # Create sync status record
-        sync_id = self.db.create_sync_status(bot_id, sync_type, start_time, end_time)
+        sync_id = await asyncio.to_thread(self.db.create_sync_status, bot_id, sync_type, start_time, end_time)
+
+        # Each flush commits on its own, so a failure later on still reports what landed
+        inserted_count = 0
 
         try:
             # Convert to milliseconds for Bybit API
@@ -71,50 +75,59 @@ class TradeSyncService:
 
             logger.info(f"Using API key for {bot_id}: {bot_creds['api_key'][:10]}...")
 
-            # Fetch closed PnL (completed trades) from Bybit using bot-specific credentials
+            record_count = 0
+            mapped_count = 0
+            skipped_count = 0
+            pending_trades = []
+
+            # Stream closed PnL (completed trades) from Bybit using bot-specific credentials,
+            # mapping each window as it arrives and flushing every SYNC_FLUSH_ROWS trades
             async with BybitSyncClient(
                 api_key=bot_creds.get('api_key'),
                 api_secret=bot_creds.get('api_secret')
             ) as client:
-                closed_pnl_records = await client.get_all_closed_pnl_in_range(
+                async for records in client.iter_closed_pnl_in_range(
                     start_time=start_ms,
                     end_time=end_ms,
                     category='linear'
-                )
-
-            if not closed_pnl_records:
+                ):
+                    record_count += len(records)
+
+                    # Pass bot_id since closed PnL doesn't include orderLinkId
+                    pending_trades.extend(self.mapper.map_iter(records, bot_id))
+                    if len(pending_trades) >= SYNC_FLUSH_ROWS:
+                        inserted, skipped = await asyncio.to_thread(self.db.bulk_insert_completed_trades, pending_trades)
+                        mapped_count += len(pending_trades)
+                        inserted_count += inserted
+                        skipped_count += skipped
+                        pending_trades = []
+
+            if pending_trades:
+                inserted, skipped = await asyncio.to_thread(self.db.bulk_insert_completed_trades, pending_trades)
+                mapped_count += len(pending_trades)
+                inserted_count += inserted
+                skipped_count += skipped
+
+            if not record_count:
                 logger.info(f"No closed PnL records found in time range")
-                self.db.update_sync_status(sync_id, 'completed', 0)
+                await asyncio.to_thread(self.db.update_sync_status, sync_id, 'completed', 0)
                 return 0, 0
 
-            logger.info(f"Found {len(closed_pnl_records)} closed PnL records from Bybit API for {bot_id}")
-
-            # Map closed PnL records to completed_trades schema
-            # Pass bot_id since closed PnL doesn't include orderLinkId
-            completed_trades = self.mapper.map_all(closed_pnl_records, bot_id)
-
-            if not completed_trades:
-                logger.info(f"No valid trades after mapping for {bot_id}")
-                self.db.update_sync_status(sync_id, 'completed', 0)
-                return 0, 0
-
-            logger.info(f"Mapped {len(completed_trades)} completed trades from closed PnL records")
-
-            # Insert into database
-            inserted_count, skipped_count = self.db.bulk_insert_completed_trades(completed_trades)
+            logger.info(f"Mapped {mapped_count} completed trades from {record_count} "
+                       f"closed PnL records from Bybit API for {bot_id}")
 
             # Update sync status
-            self.db.update_sync_status(sync_id, 'completed', inserted_count)
+            await asyncio.to_thread(self.db.update_sync_status, sync_id, 'completed', inserted_count)
 
             logger.info(f"Sync completed for {bot_id}: {inserted_count} inserted, "
                        f"{skipped_count} skipped")
 
-            return len(completed_trades), inserted_count
+            return mapped_count, inserted_count
 
         except Exception as e:
-            error_msg = f"Sync failed: {str(e)}"
+            error_msg = f"Sync failed after {inserted_count} trades inserted: {str(e)}"
             logger.error(error_msg)
-            self.db.update_sync_status(sync_id, 'failed', 0, error_msg)
+            await asyncio.to_thread(self.db.update_sync_status, sync_id, 'failed', inserted_count, error_msg)
             raise
 
     async def sync_time_range_executions(
@@ -142,7 +155,7 @@ class TradeSyncService:
         logger.info(f"Starting {sync_type} sync for {bot_id} using executions: {start_time} to {end_time}")
 
         # Create sync status record
-        sync_id = self.db.create_sync_status(bot_id, sync_type, start_time, end_time)
+        sync_id = await asyncio.to_thread(self.db.create_sync_status, bot_id, sync_type, start_time, end_time)
 
         try:
             # Convert to milliseconds for Bybit API
@@ -169,7 +182,7 @@ class TradeSyncService:
 
             if not executions:
                 logger.info(f"No executions found in time range")
-                self.db.update_sync_status(sync_id, 'completed', 0)
+                await asyncio.to_thread(self.db.update_sync_status, sync_id, 'completed', 0)
                 return 0, 0
 
             # Filter executions for this bot (by parsing orderLinkId)
@@ -184,7 +197,7 @@ class TradeSyncService:
 
             if not bot_executions:
                 logger.info(f"No executions found for {bot_id}")
-                self.db.update_sync_status(sync_id, 'completed', 0)
+                await asyncio.to_thread(self.db.update_sync_status, sync_id, 'completed', 0)
                 return 0, 0
 
             # Match buy/sell executions into completed trades
@@ -192,7 +205,7 @@ class TradeSyncService:
 
             if not matched_trades:
                 logger.info(f"No completed trades matched for {bot_id}")
-                self.db.update_sync_status(sync_id, 'completed', 0)
+                await asyncio.to_thread(self.db.update_sync_status, sync_id, 'completed', 0)
                 return 0, 0
 
             # Validate trades
@@ -207,10 +220,10 @@ class TradeSyncService:
             logger.info(f"Validated {len(valid_trades)} out of {len(matched_trades)} matched trades")
 
             # Insert into database
-            inserted_count, skipped_count = self.db.bulk_insert_completed_trades(valid_trades)
+            inserted_count, skipped_count = await asyncio.to_thread(self.db.bulk_insert_completed_trades, valid_trades)
 
             # Update sync status
-            self.db.update_sync_status(sync_id, 'completed', inserted_count)
+            await asyncio.to_thread(self.db.update_sync_status, sync_id, 'completed', inserted_count)
 
             logger.info(f"Sync completed for {bot_id}: {inserted_count} inserted, "
                        f"{skipped_count} skipped")
@@ -220,7 +233,7 @@ class TradeSyncService:
         except Exception as e:
             error_msg = f"Sync failed: {str(e)}"
             logger.error(error_msg)
-            self.db.update_sync_status(sync_id, 'failed', 0, error_msg)
+            await asyncio.to_thread(self.db.update_sync_status, sync_id, 'failed', 0, error_msg)
             raise
 
     async def backfill_bot(self, bot_id: str, months: int = BACKFILL_MONTHS):
@@ -280,23 +293,24 @@ class TradeSyncService:
         """Backfill all registered bots"""
         logger.info(f"Starting backfill for all bots: {REGISTERED_BOTS}")
 
-        results = {}
-        for bot_id in REGISTERED_BOTS:
+        async def backfill(bot_id: str) -> Dict:
             try:
                 matched, inserted = await self.backfill_bot(bot_id, months)
-                results[bot_id] = {
+                return {
                     'status': 'success',
                     'matched': matched,
                     'inserted': inserted
                 }
             except Exception as e:
                 logger.error(f"Backfill failed for {bot_id}: {str(e)}")
-                results[bot_id] = {
+                return {
                     'status': 'failed',
                     'error': str(e)
                 }
 
-        return results
+        # Bots have their own API keys and rate limits, so they backfill side by side
+        outcomes = await asyncio.gather(*(backfill(bot_id) for bot_id in REGISTERED_BOTS))
+        return dict(zip(REGISTERED_BOTS, outcomes))
 
     async def hourly_sync_bot(self, bot_id: str):
         """
@@ -329,23 +343,24 @@ class TradeSyncService:
         """Perform hourly sync for all registered bots"""
         logger.info(f"Starting hourly sync for all bots: {REGISTERED_BOTS}")
 
-        results = {}
-        for bot_id in REGISTERED_BOTS:
+        async def sync(bot_id: str) -> Dict:
             try:
                 matched, inserted = await self.hourly_sync_bot(bot_id)
-                results[bot_id] = {
+                return {
                     'status': 'success',
                     'matched': matched,
                     'inserted': inserted
                 }
             except Exception as e:
                 logger.error(f"Hourly sync failed for {bot_id}: {str(e)}")
-                results[bot_id] = {
+                return {
                     'status': 'failed',
                     'error': str(e)
                 }
 
-        return results
+        # Each bot syncs concurrently; database work runs on pooled connections in threads
+        outcomes = await asyncio.gather(*(sync(bot_id) for bot_id in REGISTERED_BOTS))
+        return dict(zip(REGISTERED_BOTS, outcomes))
 
     async def run_continuous_sync(self):
         """Run continuous hourly sync loop"""
@@ -383,7 +398,7 @@ class TradeSyncService:
         logger.info("Testing connections...")
 
         # Test database
-        db_ok = self.db.test_connection()
+        db_ok = await asyncio.to_thread(self.db.test_connection)
         if not db_ok:
             logger.error("Database connection test failed")
             return False
@@ -400,7 +415,7 @@ class TradeSyncService:
 
     async def get_sync_stats(self, bot_id: Optional[str] = None) -> Dict:
         """Get sync statistics"""
-        stats = self.db.get_sync_statistics(bot_id)
+        stats = await asyncio.to_thread(self.db.get_sync_statistics, bot_id)
 
         # Get completed trades count for each bot
         if bot_id:
@@ -410,7 +425,7 @@ class TradeSyncService:
 
         trades_count = {}
         for bot in bots:
-            trades_count[bot] = self.db.get_completed_trades_count(bot)
+            trades_count[bot] = await asyncio.to_thread(self.db.get_completed_trades_count, bot)
 
         return {
             'sync_statistics': stats,